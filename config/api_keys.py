@@ -1,10 +1,19 @@
 # config/api_keys.py
 
 import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import requests
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load environment variables from .env file (parsed once per process)"""
+    load_dotenv()
+    return True
+
 
 class APIKeys:
     """
@@ -13,21 +22,26 @@ class APIKeys:
     """
     
     def __init__(self):
+        _load_env()
+        
+        # One snapshot of the environment instead of a lookup per key
+        env = dict(os.environ)
+        
         # Required APIs
-        self.ALPACA_API_KEY = os.getenv('ALPACA_API_KEY', '')
-        self.ALPACA_SECRET_KEY = os.getenv('ALPACA_SECRET_KEY', '')
-        self.TRADIER_ACCESS_TOKEN = os.getenv('TRADIER_ACCESS_TOKEN', '')
+        self.ALPACA_API_KEY = env.get('ALPACA_API_KEY', '')
+        self.ALPACA_SECRET_KEY = env.get('ALPACA_SECRET_KEY', '')
+        self.TRADIER_ACCESS_TOKEN = env.get('TRADIER_ACCESS_TOKEN', '')
         
         # Optional backup news providers
-        self.POLYGON_API_KEY = os.getenv('POLYGON_API_KEY', '')
-        self.MARKETAUX_API_KEY = os.getenv('MARKETAUX_API_KEY', '')
-        self.FMP_API_KEY = os.getenv('FMP_API_KEY', '')
-        self.NEWSAPI_API_KEY = os.getenv('NEWSAPI_API_KEY', '')
-        self.ALPHAVANTAGE_API_KEY = os.getenv('ALPHAVANTAGE_API_KEY', '')
-        self.FINNHUB_API_KEY = os.getenv('FINNHUB_API_KEY', '')
+        self.POLYGON_API_KEY = env.get('POLYGON_API_KEY', '')
+        self.MARKETAUX_API_KEY = env.get('MARKETAUX_API_KEY', '')
+        self.FMP_API_KEY = env.get('FMP_API_KEY', '')
+        self.NEWSAPI_API_KEY = env.get('NEWSAPI_API_KEY', '')
+        self.ALPHAVANTAGE_API_KEY = env.get('ALPHAVANTAGE_API_KEY', '')
+        self.FINNHUB_API_KEY = env.get('FINNHUB_API_KEY', '')
         
         # AI provider (optional)
-        self.PERPLEXITY_API_KEY = os.getenv('PERPLEXITY_API_KEY', '')
+        self.PERPLEXITY_API_KEY = env.get('PERPLEXITY_API_KEY', '')
     
     def validate(self):
         """Check if required API keys are present"""
@@ -48,6 +62,75 @@ class APIKeys:
         print("[API-KEYS] ✓ All required API keys loaded")
         return True
     
+    def validate_live(self, timeout: float = 5.0) -> dict:
+        """
+        Probe each configured provider to confirm its key is accepted.
+        Probes run in parallel, so total latency is the slowest single probe.
+        
+        Returns:
+            {provider: True/False} for every provider that has a key set
+        """
+        probes = self._live_probes()
+        if not probes:
+            print("[API-KEYS] ⚠️ No API keys configured to verify")
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+            futures = {
+                name: pool.submit(self._probe, url, headers, timeout)
+                for name, (url, headers) in probes.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+        
+        rejected = [name for name, ok in results.items() if not ok]
+        if rejected:
+            print(f"[API-KEYS] ⚠️ Keys rejected or unreachable: {', '.join(rejected)}")
+        else:
+            print(f"[API-KEYS] ✓ Verified {len(results)} API keys with providers")
+        return results
+    
+    def _live_probes(self) -> dict:
+        """Build {provider: (url, headers)} for each provider with a key set"""
+        probes = {}
+        
+        if self.ALPACA_API_KEY and self.ALPACA_SECRET_KEY:
+            probes['ALPACA'] = (
+                'https://paper-api.alpaca.markets/v2/account',
+                {
+                    'APCA-API-KEY-ID': self.ALPACA_API_KEY,
+                    'APCA-API-SECRET-KEY': self.ALPACA_SECRET_KEY
+                }
+            )
+        if self.TRADIER_ACCESS_TOKEN:
+            probes['TRADIER'] = (
+                'https://api.tradier.com/v1/user/profile',
+                {
+                    'Authorization': f'Bearer {self.TRADIER_ACCESS_TOKEN}',
+                    'Accept': 'application/json'
+                }
+            )
+        if self.POLYGON_API_KEY:
+            probes['POLYGON'] = (
+                f'https://api.polygon.io/v3/reference/tickers?limit=1&apiKey={self.POLYGON_API_KEY}',
+                {}
+            )
+        if self.FINNHUB_API_KEY:
+            probes['FINNHUB'] = (
+                f'https://finnhub.io/api/v1/quote?symbol=AAPL&token={self.FINNHUB_API_KEY}',
+                {}
+            )
+        
+        return probes
+    
+    @staticmethod
+    def _probe(url: str, headers: dict, timeout: float) -> bool:
+        """Status-only check - the response body is never read"""
+        try:
+            with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+                return response.status_code == 200
+        except requests.RequestException:
+            return False
+    
     def get_alpaca_credentials(self):
         """Get Alpaca API credentials"""
         return {
@@ -60,17 +143,43 @@ class APIKeys:
         return self.TRADIER_ACCESS_TOKEN
 
 
-# Singleton instance
-api_keys = APIKeys()
+@lru_cache(maxsize=1)
+def get_api_keys() -> APIKeys:
+    """Shared APIKeys, created on first use"""
+    return APIKeys()
+
+
+class _LiveKeys(Mapping):
+    """
+    Read-only dict view over the shared APIKeys instance.
+    Values are looked up on access, so re-initialized keys are seen by
+    every scanner without re-importing.
+    """
+    
+    # Exported name -> APIKeys attribute
+    _FIELDS = {
+        'ALPACA_API_KEY': 'ALPACA_API_KEY',
+        'ALPACA_SECRET_KEY': 'ALPACA_SECRET_KEY',
+        'TRADIER_API_KEY': 'TRADIER_ACCESS_TOKEN',
+        'POLYGON_API_KEY': 'POLYGON_API_KEY',
+        'FINNHUB_API_KEY': 'FINNHUB_API_KEY'
+    }
+    
+    def __getitem__(self, key):
+        return getattr(get_api_keys(), self._FIELDS[key], None)
+    
+    def __iter__(self):
+        return iter(self._FIELDS)
+    
+    def __len__(self):
+        return len(self._FIELDS)
+    
+    def __repr__(self):
+        return f"<API_KEYS {', '.join(self._FIELDS)}>"
+
 
 # Export as dictionary for scanners
-API_KEYS = {
-    'ALPACA_API_KEY': api_keys.ALPACA_API_KEY,
-    'ALPACA_SECRET_KEY': api_keys.ALPACA_SECRET_KEY,
-    'TRADIER_API_KEY': api_keys.TRADIER_ACCESS_TOKEN,
-    'POLYGON_API_KEY': getattr(api_keys, 'POLYGON_API_KEY', None),
-    'FINNHUB_API_KEY': getattr(api_keys, 'FINNHUB_API_KEY', None)
-}
+API_KEYS = _LiveKeys()
 
 def validate_api_keys():
     """
@@ -84,6 +193,7 @@ def validate_api_keys():
     ]
     
     missing_keys = []
+    api_keys = get_api_keys()
     
     for key in required_keys:
         # Check if attribute exists and is not empty
@@ -4,6 +4,8 @@ Shared keywords for both Breaking News (≤2 hrs) and General News (2-72 hrs)
 Only difference is article age
 """
 
+import re
+
 # Shared News Keywords (used for both breaking and general news)
 NEWS_KEYWORDS = [
     # Bankruptcy & Financial Distress
@@ -130,37 +132,118 @@ EXCLUDE_KEYWORDS = [
 ]
 
 
+def _minimal_keywords(keywords) -> tuple:
+    """
+    Lowercase keywords and drop any that contain a shorter keyword.
+    e.g. 'strategic partnership with' is redundant next to 'strategic partnership'
+    """
+    ordered = sorted({keyword.lower() for keyword in keywords}, key=len)
+    minimal = []
+    for keyword in ordered:
+        if not any(shorter in keyword for shorter in minimal):
+            minimal.append(keyword)
+    return tuple(minimal)
+
+
+def _trie_regex(node: dict) -> str:
+    """Emit a prefix-factored regex for one trie node ('' marks end of keyword)"""
+    branches = []
+    single_chars = []
+    for char in sorted(c for c in node if c):
+        tail = _trie_regex(node[char])
+        if tail:
+            branches.append(re.escape(char) + tail)
+        else:
+            single_chars.append(re.escape(char))
+    
+    if single_chars:
+        branches.append(single_chars[0] if len(single_chars) == 1 else f"[{''.join(single_chars)}]")
+    if not branches:
+        return ''
+    
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    return f"(?:{body})?" if '' in node else body
+
+
+def _compile_keywords(keywords) -> re.Pattern:
+    """
+    Build one pattern so a headline is scanned in a single pass.
+    Keywords are merged into a trie first, so shared prefixes like
+    'ceo ' or 'bitcoin ' are tested once per position instead of once per keyword.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return re.compile(_trie_regex(trie))
+
+
+# Reduced + compiled once at import - keyword lists are static
+_NEWS_MATCH_KEYWORDS = _minimal_keywords(NEWS_KEYWORDS)
+_EXCLUDE_MATCH_KEYWORDS = _minimal_keywords(EXCLUDE_KEYWORDS)
+_NEWS_PATTERN = _compile_keywords(_NEWS_MATCH_KEYWORDS)
+_EXCLUDE_PATTERN = _compile_keywords(_EXCLUDE_MATCH_KEYWORDS)
+
+
+def _matches(headline_lower: str) -> bool:
+    """Keyword check on an already-lowercased headline"""
+    return _NEWS_PATTERN.search(headline_lower) is not None
+
+
+def _excludes(headline_lower: str) -> bool:
+    """Spam check on an already-lowercased headline"""
+    return _EXCLUDE_PATTERN.search(headline_lower) is not None
+
+
 def matches_news_keywords(headline: str) -> bool:
     """
     Check if headline contains ANY news keyword.
     Used for BOTH breaking news (≤2 hrs) and general news (2-72 hrs).
     Age is checked separately.
     """
-    headline_lower = headline.lower()
-    return any(keyword in headline_lower for keyword in NEWS_KEYWORDS)
+    return _matches(headline.lower())
+
+
+def match_news_keywords_batch(headlines) -> list:
+    """
+    Keyword-match a batch of headlines in one tight loop.
+    Returns a list of bools aligned with the input (non-str headlines are misses).
+    """
+    search = _NEWS_PATTERN.search
+    return [
+        isinstance(headline, str) and search(headline.lower()) is not None
+        for headline in headlines
+    ]
 
 
 def should_exclude(headline: str) -> bool:
     """Check if headline should be excluded (spam filter)"""
-    headline_lower = headline.lower()
-    return any(keyword in headline_lower for keyword in EXCLUDE_KEYWORDS)
+    return _excludes(headline.lower())
 
 
-def categorize_news_by_age(headline: str, age_hours: float) -> str:
+def categorize_news_by_age(headline: str, age_hours: float, matched: bool = None) -> str:
     """
     Categorize news based on age and keyword match.
+    Pass matched to reuse a keyword result already computed for this headline.
     
     Returns:
         'breaking' - ≤0.5 hours old + keyword match
         'general' - 0.5-48 hours old + keyword match
         'ignore' - Outside age range or no keyword match
     """
+    # Lowercase once and share it between both checks
+    headline_lower = headline.lower()
+    
     # Check keyword match first
-    if not matches_news_keywords(headline):
+    if matched is None:
+        matched = _matches(headline_lower)
+    if not matched:
         return 'ignore'
     
     # Check if excluded
-    if should_exclude(headline):
+    if _excludes(headline_lower):
         return 'ignore'
     
     # Categorize by age
@@ -1,11 +1,22 @@
 # core/file_manager.py
 
+import atexit
+import hashlib
 import json
+import logging
 import os
 import shutil
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+import orjson
+
+from core.logger import setup_console
+
+log = logging.getLogger('signalscan.file_manager')
+
 class FileManager:
     """
     Handles all JSON file operations for SignalScan PRO
@@ -16,6 +27,9 @@ class FileManager:
     """
     
     def __init__(self):
+        # Startup lines below go to the shared console
+        setup_console()
+        
         # Define all file paths
         self.DATA_DIR = "data"
         self.LOGS_DIR = "logs"
@@ -30,6 +44,21 @@ class FileManager:
             'active_halts': os.path.join(self.DATA_DIR, 'active_halts.json')
         }
         
+        # Last write per file: {file_key: (content_digest, mtime_ns)}
+        self._last_write = {}
+        
+        # Parsed file cache: {file_key: ((inode, mtime_ns, size), data)}
+        self._load_cache = {}
+        
+        # Debounced writes waiting to be flushed: {file_key: data}
+        self._pending = {}
+        self._pending_timers = {}
+        self._pending_lock = threading.Lock()
+        # Held across "pick the data" + "write it" so an explicit save and a
+        # debounced flush of the same file can't interleave
+        self._write_locks = {file_key: threading.Lock() for file_key in self.files}
+        atexit.register(self.flush_pending)
+        
         # Create directories if they don't exist
         self._create_directories()
         
@@ -39,9 +68,11 @@ class FileManager:
     def _create_directories(self):
         """Create data, logs, and backup directories"""
         for directory in [self.DATA_DIR, self.LOGS_DIR, self.BACKUP_DIR]:
-            if not os.path.exists(directory):
+            try:
                 os.makedirs(directory)
-                print(f"[FILE-MANAGER] Created directory: {directory}")
+                log.info("[FILE-MANAGER] Created directory: %s", directory)
+            except FileExistsError:
+                pass
         
     def init_directories(self):
         """Public method to initialize/verify directories exist"""
@@ -50,19 +81,31 @@ class FileManager:
     
     def _initialize_files(self):
         """Create empty JSON files if they don't exist"""
+        # One directory listing instead of a stat per file
+        with os.scandir(self.DATA_DIR) as entries:
+            existing = {entry.name for entry in entries}
+        
         for file_key, file_path in self.files.items():
-            if not os.path.exists(file_path):
+            if os.path.basename(file_path) not in existing:
                 default_data = {} if file_key != 'prefilter' and file_key != 'validated' else []
                 self.save_json(file_key, default_data)
-                print(f"[FILE-MANAGER] Initialized: {file_path}")
+                log.info("[FILE-MANAGER] Initialized: %s", file_path)
     
-    def load_json(self, file_key: str, default: Any = None) -> Any:
+    def load_json(self, file_key: str, default: Any = None, copy: bool = True) -> Any:
         """
         Load JSON file by key
         
+        Parsed data is cached until the file changes on disk, and data
+        queued by save_json_debounced() is returned before it is flushed.
+        The returned container is a fresh shallow copy, but the records
+        inside it are shared with the cache and should be treated as read-only.
+        
         Args:
             file_key: Key from self.files dict (e.g., 'prefilter', 'news')
             default: Default value if file doesn't exist or is invalid
+            copy: False skips the shallow copy of data parsed from disk,
+                for callers that only read it (the cached container is
+                replaced, never mutated, when the file changes)
         
         Returns:
             Loaded data or default value
@@ -74,23 +117,61 @@ class FileManager:
                 #print(f"[FILE-MANAGER] ⚠️ Unknown file key: {file_key}")
                 return default
             
-            if not os.path.exists(file_path):
-                #print(f"[FILE-MANAGER] ⚠️ File not found: {file_path}")
-                return default
+            # A debounced write that hasn't hit disk yet is the latest state
+            with self._pending_lock:
+                pending = file_key in self._pending
+                data = self._pending.get(file_key)
+            
+            if not pending:
+                try:
+                    st = os.stat(file_path)
+                except FileNotFoundError:
+                    #print(f"[FILE-MANAGER] ⚠️ File not found: {file_path}")
+                    return default
+                data = self._load_from_disk(file_key, file_path, st)
             
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                #   print(f"[FILE-MANAGER] ✓ Loaded {file_key}: {len(data) if isinstance(data, (list, dict)) else 'N/A'} items")
+            # Callers add/remove entries before saving - hand out a shallow
+            # copy so the cached container is never mutated underneath us
+            # (queued debounced data is the saver's own object, so always copied)
+            if not copy and not pending:
                 return data
+            if isinstance(data, dict):
+                return dict(data)
+            if isinstance(data, list):
+                return list(data)
+            return data
         
-        except json.JSONDecodeError as e:
-            #print(f"[FILE-MANAGER] ❌ JSON decode error in {file_key}: {e}")
+        except ValueError as e:
+            # Unreadable even by the stdlib parser - callers get the default
+            log.error("[FILE-MANAGER] ❌ JSON decode error in %s: %s", file_key, e)
             return default
         
         except Exception as e:
-            #print(f"[FILE-MANAGER] ❌ Error loading {file_key}: {e}")
+            log.error("[FILE-MANAGER] ❌ Error loading %s: %s", file_key, e)
             return default
     
+    def _load_from_disk(self, file_key: str, file_path: str, st: os.stat_result) -> Any:
+        """Parse a data file, reusing the cached result if it hasn't changed"""
+        # Only re-parse when the file changed on disk (saves replace the
+        # inode, so this also catches same-size writes within one mtime tick)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._load_cache.get(file_key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            # Files written by json.dump can hold NaN/Infinity tokens, which
+            # orjson rejects - the stdlib parser still reads them
+            data = json.loads(raw)
+            log.warning("[FILE-MANAGER] %s: orjson rejected the file (%s), parsed with json instead", file_key, e)
+        self._load_cache[file_key] = (signature, data)
+        #   print(f"[FILE-MANAGER] ✓ Loaded {file_key}: {len(data) if isinstance(data, (list, dict)) else 'N/A'} items")
+        return data
+    
     def save_json(self, file_key: str, data: Any) -> bool:
         """
         Save data to JSON file
@@ -109,35 +190,165 @@ class FileManager:
                 #print(f"[FILE-MANAGER] ⚠️ Unknown file key: {file_key}")
                 return False
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # An explicit save supersedes any queued debounced write
+            with self._write_locks[file_key]:
+                self._cancel_pending(file_key)
+                return self._write_json(file_key, data)
+        
+        except Exception as e:
+            log.error("[FILE-MANAGER] ❌ Error saving %s: %s", file_key, e)
+            return False
+    
+    def _write_json(self, file_key: str, data: Any) -> bool:
+        """Serialize and atomically write data, skipping unchanged content"""
+        try:
+            file_path = self.files[file_key]
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            
+            # Skip the write if we already wrote this exact content and
+            # nobody has touched the file since
+            last = self._last_write.get(file_key)
+            if last and last[0] == digest:
+                try:
+                    if os.stat(file_path).st_mtime_ns == last[1]:
+                        return True
+                except OSError:
+                    pass
+            
+            # Write to a temp file and rename so readers never see a partial file
+            tmp_path = f"{file_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+            
+            self._last_write[file_key] = (digest, os.stat(file_path).st_mtime_ns)
 
             #print(f"[FILE-MANAGER] ✓ Saved {file_key}: {len(data) if isinstance(data, (list, dict)) else 'N/A'} items")
             return True
         
         except Exception as e:
-            print(f"[FILE-MANAGER] ❌ Error saving {file_key}: {e}")
+            log.error("[FILE-MANAGER] ❌ Error saving %s: %s", file_key, e)
             return False
     
+    def save_json_debounced(self, file_key: str, data: Any, delay: float = 1.0) -> bool:
+        """
+        Queue data to be saved after `delay` seconds
+        
+        Repeated calls within the window only keep the latest data, so a
+        burst of updates becomes a single write. load_json() returns the
+        queued data until it has been flushed.
+        
+        Args:
+            file_key: Key from self.files dict
+            data: Data to save (must be JSON-serializable)
+            delay: Seconds to wait before writing
+        
+        Returns:
+            True if queued, False for an unknown file key
+        """
+        if file_key not in self.files:
+            return False
+        
+        # Snapshot the container so later mutation by the caller can't race the flush
+        if isinstance(data, dict):
+            data = dict(data)
+        elif isinstance(data, list):
+            data = list(data)
+        
+        with self._pending_lock:
+            self._pending[file_key] = data
+            if file_key not in self._pending_timers:
+                timer = threading.Timer(delay, self._flush_key, args=(file_key,))
+                timer.daemon = True
+                self._pending_timers[file_key] = timer
+                timer.start()
+        return True
+    
+    def _flush_key(self, file_key: str):
+        """Write the queued data for one file"""
+        with self._write_locks[file_key]:
+            with self._pending_lock:
+                self._pending_timers.pop(file_key, None)
+                if file_key not in self._pending:
+                    return  # Already flushed, or superseded by save_json
+                data = self._pending[file_key]
+            
+            self._write_json(file_key, data)
+            
+            # Keep newer data queued while we were writing
+            with self._pending_lock:
+                if self._pending.get(file_key) is data:
+                    del self._pending[file_key]
+    
+    def _cancel_pending(self, file_key: str):
+        """Drop any queued write for a file"""
+        with self._pending_lock:
+            self._pending.pop(file_key, None)
+            timer = self._pending_timers.pop(file_key, None)
+        if timer:
+            timer.cancel()
+    
+    def flush_pending(self):
+        """Write all queued debounced saves now"""
+        with self._pending_lock:
+            keys = list(self._pending)
+        for file_key in keys:
+            self._flush_key(file_key)
+    
     def backup_all(self, reason: str = "manual"):
         """
         Create timestamped backup of all data files
         
+        Files unchanged since the previous backup are hardlinked to that
+        backup's copy instead of being copied again.
+        
         Args:
             reason: Reason for backup (e.g., "pre-update", "daily", "manual")
         """
         try:
+            self.flush_pending()
+            
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_path = os.path.join(self.BACKUP_DIR, f"{timestamp}_{reason}")
             
             os.makedirs(backup_path, exist_ok=True)
             
+            # Content hash + location of the last backed-up copy of each file
+            hashes_path = os.path.join(self.BACKUP_DIR, '.hashes.json')
+            try:
+                with open(hashes_path, 'rb') as f:
+                    previous = orjson.loads(f.read())
+            except (OSError, orjson.JSONDecodeError):
+                previous = {}
+            
+            current = {}
             backed_up = 0
             for file_key, file_path in self.files.items():
-                if os.path.exists(file_path):
-                    backup_file = os.path.join(backup_path, os.path.basename(file_path))
+                try:
+                    with open(file_path, 'rb') as f:
+                        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+                except FileNotFoundError:
+                    continue
+                
+                backup_file = os.path.join(backup_path, os.path.basename(file_path))
+                last = previous.get(file_key)
+                linked = False
+                if last and last.get('hash') == digest:
+                    try:
+                        os.link(last['path'], backup_file)
+                        linked = True
+                    except OSError:
+                        # Previous copy gone or cross-device - fall back to a copy
+                        pass
+                if not linked:
                     shutil.copy2(file_path, backup_file)
-                    backed_up += 1
+                
+                current[file_key] = {'hash': digest, 'path': backup_file}
+                backed_up += 1
+            
+            with open(hashes_path, 'wb') as f:
+                f.write(orjson.dumps(current, option=orjson.OPT_INDENT_2))
 
             #print(f"[FILE-MANAGER] ✓ Backup created: {backup_path} ({backed_up} files)")
             return backup_path
@@ -238,13 +449,15 @@ class FileManager:
         """Save general news"""
         self.save_json('news', data)
     
-    def load_bkgnews(self) -> dict:
-        """Load breaking news"""
-        return self.load_json('bkgnews', default={})
+    def load_bkgnews(self, copy: bool = True) -> dict:
+        """Load breaking news (copy=False for read-only use, see load_json)"""
+        return self.load_json('bkgnews', default={}, copy=copy)
     
     def save_bkgnews(self, data: dict):
         """Save breaking news"""
         self.save_json('bkgnews', data)
         
-# Singleton instance
-file_manager = FileManager()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_file_manager() -> FileManager:
+    """Shared FileManager, created on first use"""
+    return FileManager()
\ No newline at end of file
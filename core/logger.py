@@ -1,8 +1,58 @@
 # core/logger.py
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
+
+
+def setup_console():
+    """
+    Console output for all SignalScan loggers (set up by the first Logger
+    or FileManager).
+    Records are queued by the caller and written to stdout by a background
+    listener thread, so scanner threads never block on the stdout lock.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setLevel(logging.INFO)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_stop_console)
+    
+    console.addHandler(logging.handlers.QueueHandler(log_queue))
+    console.setLevel(logging.DEBUG)
+    console.propagate = False
+
+
+def _stop_console():
+    """Drain queued console records and stop the listener thread"""
+    global _listener
+    if _listener is None:
+        return
+    for handler in list(console.handlers):
+        console.removeHandler(handler)
+    console.propagate = True
+    _listener.stop()
+    _listener = None
+
+
+# No handlers or threads until a Logger is created
+console = logging.getLogger('signalscan')
+_listener = None
+
 
 class Logger:
     """
@@ -11,6 +61,7 @@ class Logger:
     """
     
     def __init__(self):
+        setup_console()
         self.logs_dir = "logs"
         
         # Ensure logs directory exists
@@ -26,9 +77,71 @@ class Logger:
             'crash': os.path.join(self.logs_dir, f'crash_log_{today}.log')
         }
         
+        # Keep one buffered handle per log instead of reopening per message
+        self._handles = {
+            log_type: open(log_path, 'ab', buffering=65536)
+            for log_type, log_path in self.log_files.items()
+        }
+        self.flush_interval = 1.0  # seconds
+        # Buffers are flushed on a timer, so a quiet log's tail still reaches
+        # disk within flush_interval even if no further write comes
+        self._closed = threading.Event()
+        threading.Thread(target=self._flush_loop, name='logger-flush', daemon=True).start()
+        # Flush only - daemon scanner threads may still log during shutdown
+        atexit.register(self.flush)
+        
+        # Timestamp string is only reformatted when the second rolls over
+        self._ts_sec = 0
+        self._ts_str = ''
+        
         # Log initialization
         for log_type, log_path in self.log_files.items():
-            print(f"[LOGGER] Logging {log_type} to: {log_path}")
+            console.info("[LOGGER] Logging %s to: %s", log_type, log_path)
+    
+    def _timestamp(self) -> str:
+        """Current 'YYYY-mm-dd HH:MM:SS' string, cached per second"""
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        return self._ts_str
+    
+    def _write(self, log_type: str, log_entry: str):
+        """Append entry to a log file, flushing at most once per interval"""
+        handle = self._handles[log_type]
+        if handle.closed:
+            # close() already ran - append directly so late messages aren't lost
+            with open(self.log_files[log_type], 'ab') as f:
+                f.write(log_entry.encode('utf-8'))
+            return
+        handle.write(log_entry.encode('utf-8'))
+        
+        # Crashes are flushed immediately so they survive a hard exit;
+        # everything else is flushed by _flush_loop
+        if log_type == 'crash':
+            self.flush()
+    
+    def _flush_loop(self):
+        """Flush buffered writes every flush_interval until close()"""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+    
+    def flush(self):
+        """Flush all buffered log writes to disk"""
+        for handle in self._handles.values():
+            try:
+                if not handle.closed:
+                    handle.flush()
+            except ValueError:
+                pass  # Closed by close() between the check and the flush
+    
+    def close(self):
+        """Flush and close all log files and stop the console listener"""
+        self._closed.set()
+        for handle in self._handles.values():
+            if not handle.closed:
+                handle.close()
+        _stop_console()
     
     def _setup_loggers(self):
         """Set up loggers for different components"""
@@ -63,7 +176,7 @@ class Logger:
             logger.addHandler(file_handler)
             
             self.loggers[name] = logger
-            print(f"[LOGGER] Logging {name} to: {file_path}")
+            console.info("[LOGGER] Logging %s to: %s", name, file_path)
     
     def get_logger(self, name: str):
         """Get logger by name"""
@@ -77,43 +190,41 @@ class Logger:
 
     def scanner(self, message: str):
         """Log scanner activity"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self._timestamp()
         log_entry = f"[{timestamp}] {message}\n"
         
-        with open(self.log_files['scanner'], 'a') as f:
-            f.write(log_entry)
+        self._write('scanner', log_entry)
         
-        print(message)
+        console.info(message)
     
     def news(self, message: str):
         """Log news activity"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self._timestamp()
         log_entry = f"[{timestamp}] {message}\n"
         
-        with open(self.log_files['news'], 'a') as f:
-            f.write(log_entry)
+        self._write('news', log_entry)
         
-        print(message)
+        console.info(message)
     
     def halt(self, message: str):
         """Log halt activity"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self._timestamp()
         log_entry = f"[{timestamp}] {message}\n"
         
-        with open(self.log_files['halt'], 'a') as f:
-            f.write(log_entry)
+        self._write('halt', log_entry)
         
-        print(message)
+        console.info(message)
     
     def crash(self, message: str):
         """Log errors and crashes"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self._timestamp()
         log_entry = f"[{timestamp}] ERROR: {message}\n"
         
-        with open(self.log_files['crash'], 'a') as f:
-            f.write(log_entry)
+        self._write('crash', log_entry)
         
-        print(f"[ERROR] {message}")
+        console.error("[ERROR] %s", message)
 
-# Singleton instance
-logger_system = Logger()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_logger() -> Logger:
+    """Shared Logger, created on first use"""
+    return Logger()
\ No newline at end of file
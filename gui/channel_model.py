@@ -0,0 +1,226 @@
+"""
+SignalScan PRO - Channel Table Model
+Column-oriented table model for the channel, news and halt views.
+Rows are stored as plain Python lists per column (no per-cell QObjects),
+so Qt only formats and paints the rows that are actually visible.
+"""
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+
+_KEEP = object()
+
+
+class ChannelModel(QAbstractTableModel):
+    """
+    Table model keyed by a row key (usually the symbol)
+
+    Storage is one list per column:
+    - data_cols: display text
+    - fg_cols: foreground QBrush/QColor or None
+    - font_cols: QFont or None
+    plus one payload per row (returned for Qt.UserRole, e.g. news data).
+    """
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.cols = tuple(columns)
+        self.data_cols = {name: [] for name in self.cols}
+        self.fg_cols = {name: [] for name in self.cols}
+        self.font_cols = {name: [] for name in self.cols}
+        self.payloads = []
+        self.row_keys = []
+        self.row_index = {}  # key -> row
+
+        # Column-position views of the same lists for data()
+        self._text_by_col = [self.data_cols[name] for name in self.cols]
+        self._fg_by_col = [self.fg_cols[name] for name in self.cols]
+        self._font_by_col = [self.font_cols[name] for name in self.cols]
+
+    # ------------------------------------------------------------------
+    # Qt model interface
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.row_keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.cols)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.cols[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Answer only the roles we style - everything else is None so Qt
+        # falls back to the view defaults without further queries
+        if role == Qt.DisplayRole:
+            return self._text_by_col[index.column()][index.row()]
+        if role == Qt.ForegroundRole:
+            return self._fg_by_col[index.column()][index.row()]
+        if role == Qt.FontRole:
+            return self._font_by_col[index.column()][index.row()]
+        if role == Qt.UserRole:
+            return self.payloads[index.row()]
+        return None
+
+    # ------------------------------------------------------------------
+    # Row updates
+    # ------------------------------------------------------------------
+
+    def upsert(self, key, texts, fgs=None, fonts=None, payload=None):
+        """
+        Update the row for key in place, or append it if new
+
+        Args:
+            key: Row key (symbol, or (symbol, headline) for news)
+            texts: Display text per column
+            fgs: Foreground brush per column (None = default)
+            fonts: Font per column (None = default)
+            payload: Object returned for Qt.UserRole on this row
+
+        Returns:
+            Row index
+        """
+        row = self.row_index.get(key)
+        if row is None:
+            row = len(self.row_keys)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._append(key, texts, fgs, fonts, payload)
+            self.endInsertRows()
+            return row
+
+        changed = self._assign(row, texts, fgs, fonts, payload)
+        if changed is None:
+            return row
+        self.dataChanged.emit(
+            self.index(row, changed[0]),
+            self.index(row, changed[1]),
+            [Qt.DisplayRole, Qt.ForegroundRole, Qt.FontRole]
+        )
+        return row
+
+    def set_cell(self, row, col, text, fg=None, font=None, payload=_KEEP):
+        """Overwrite a single cell (and optionally the row payload)"""
+        self._text_by_col[col][row] = text
+        self._fg_by_col[col][row] = fg
+        self._font_by_col[col][row] = font
+        if payload is not _KEEP:
+            self.payloads[row] = payload
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ForegroundRole, Qt.FontRole])
+
+    def remove(self, key) -> bool:
+        """Remove the row for key; returns False if it isn't present"""
+        row = self.row_index.get(key)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for column in (*self._text_by_col, *self._fg_by_col, *self._font_by_col):
+            del column[row]
+        del self.payloads[row]
+        del self.row_keys[row]
+        del self.row_index[key]
+        # Rows after the removed one shift up by one
+        for shifted in range(row, len(self.row_keys)):
+            self.row_index[self.row_keys[shifted]] = shifted
+        self.endRemoveRows()
+        return True
+
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self._clear_rows()
+        self.endResetModel()
+
+    def reset_rows(self, rows):
+        """
+        Replace every row in one model reset (bulk loads)
+
+        Args:
+            rows: Iterable of (key, texts, fgs, fonts, payload); a repeated
+                key keeps its first row
+        """
+        self.beginResetModel()
+        self._clear_rows()
+        for key, texts, fgs, fonts, payload in rows:
+            if key not in self.row_index:
+                self._append(key, texts, fgs, fonts, payload)
+        self.endResetModel()
+
+    def row_of(self, key) -> int:
+        """Row index for key, or -1"""
+        return self.row_index.get(key, -1)
+
+    def payload(self, row):
+        """Payload stored for row (None if out of range)"""
+        if 0 <= row < len(self.payloads):
+            return self.payloads[row]
+        return None
+
+    def _clear_rows(self):
+        """Empty every column list and the row index"""
+        for column in (*self._text_by_col, *self._fg_by_col, *self._font_by_col):
+            column.clear()
+        self.payloads.clear()
+        self.row_keys.clear()
+        self.row_index.clear()
+
+    def _append(self, key, texts, fgs, fonts, payload):
+        """Append one row to every column list and index it"""
+        width = len(self.cols)
+        fgs = fgs or (None,) * width
+        fonts = fonts or (None,) * width
+        for col in range(width):
+            self._text_by_col[col].append(texts[col])
+            self._fg_by_col[col].append(fgs[col])
+            self._font_by_col[col].append(fonts[col])
+        self.payloads.append(payload)
+        self.row_index[key] = len(self.row_keys)
+        self.row_keys.append(key)
+
+    def _assign(self, row, texts, fgs, fonts, payload):
+        """
+        Overwrite one row in place, touching only cells whose value changed
+
+        Returns:
+            (first, last) changed column, or None if the row is unchanged
+        """
+        width = len(self.cols)
+        fgs = fgs or (None,) * width
+        fonts = fonts or (None,) * width
+        first = last = None
+        for col in range(width):
+            text_col = self._text_by_col[col]
+            fg_col = self._fg_by_col[col]
+            font_col = self._font_by_col[col]
+            # Brushes/fonts are shared constants, so identity is enough
+            if text_col[row] != texts[col] or fg_col[row] is not fgs[col] or font_col[row] is not fonts[col]:
+                text_col[row] = texts[col]
+                fg_col[row] = fgs[col]
+                font_col[row] = fonts[col]
+                if first is None:
+                    first = col
+                last = col
+        self.payloads[row] = payload
+        return None if first is None else (first, last)
+
+
+class NewestFirstProxy(QSortFilterProxyModel):
+    """
+    Newest-first view over an append-only ChannelModel
+
+    Rows are ordered by their payload (epoch seconds), so the source model
+    only ever appends and Qt maps the new row into place instead of every
+    existing row shifting down.
+    """
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.setSourceModel(source)
+        self.setDynamicSortFilter(True)
+        self.sort(0, Qt.DescendingOrder)
+
+    def lessThan(self, left, right):
+        payloads = self.sourceModel().payloads
+        return (payloads[left.row()] or 0.0) < (payloads[right.row()] or 0.0)
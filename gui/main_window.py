@@ -7,46 +7,418 @@ News & Halts: Vault system (persistent storage + live updates)
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTabWidget, QTableWidget, QTableWidgetItem, QLabel,
+    QTabWidget, QTableView, QAbstractItemView, QLabel,
     QPushButton, QStatusBar, QHeaderView, QFrame
 )
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal, pyqtSlot
-from PyQt5.QtMultimedia import QSound
-from PyQt5.QtGui import QColor, QFont, QPixmap
-from datetime import datetime
-import pytz
+from PyQt5.QtCore import (
+    QObject, QRunnable, QThread, QThreadPool, QTimer, Qt, QUrl, pyqtSignal, pyqtSlot
+)
+from PyQt5.QtMultimedia import QSoundEffect
+from PyQt5.QtGui import QBrush, QColor, QFont, QPixmap
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from dateutil import parser
+from functools import lru_cache
+from operator import itemgetter
 import json
 import os
+import sys
+import time
+import traceback
+from threading import Thread
+from zoneinfo import ZoneInfo
+
+from gui.channel_model import ChannelModel, NewestFirstProxy
+from gui.news_popup import NewsPopup
+
+# Cell formatters - bound str.format, so the format spec is parsed once
+PRICE_FMT = "{:.2f}".format
+DOLLAR_FMT = "${:.2f}".format
+PCT_FMT = "{:.2f}%".format
+SIGNED_PCT_FMT = "{:+.2f}%".format
+SCORE_FMT = "{:.1f}".format
+CONFIDENCE_FMT = "{:.1f}%".format
+HIST_FMT = "{:.3f}".format
+VWAP_FMT = "{:.2f}σ".format
+VOLUME_FMT = "{:,}".format
+MILLIONS_FMT = "{:.1f}M".format
+
+# Verbose per-refresh vault diagnostics (off: one summary line per refresh)
+DEBUG_VAULT = False
+
+# Timezones used for halt/MOMO display
+_EST = ZoneInfo('America/New_York')
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=4096)
+def _parse_dt(time_str):
+    """Parse a halt/news time string (ISO or RSS pubDate) - cached per raw string"""
+    # Vault times are almost always ISO-8601 - dateutil only for the rest
+    try:
+        return datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+    except ValueError:
+        return parser.parse(time_str)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_halt_time(time_str):
+    """Halt time -> '3:57pm - tue, 11 nov' in US/Eastern (naive times are UTC)"""
+    dt = _parse_dt(time_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)  # Assume UTC if no timezone
+    return dt.astimezone(_EST).strftime('%I:%M%p - %a, %d %b').lower()
+
+
+@lru_cache(maxsize=4096)
+def _fmt_resume_time(time_str):
+    """Resume time -> '11/11 11:45' (as given, no tz conversion)"""
+    return _parse_dt(time_str).strftime('%m/%d %H:%M')
+
+
+@lru_cache(maxsize=4096)
+def _halt_sort_time(time_str):
+    """Unix timestamp for sorting halts (0 if unparseable, so it sorts last)"""
+    try:
+        return _parse_dt(time_str).timestamp()
+    except Exception:
+        return 0
+
+
+def _symbol(data):
+    """Interned symbol from an update dict - symbols repeat every tick, so the
+    per-table row dicts and tier3 lookups hash them once and compare by identity"""
+    symbol = data.get('symbol')
+    return sys.intern(symbol) if isinstance(symbol, str) else symbol
+
+
+def _age_str(age_sec):
+    """Age in whole seconds -> '42m' under an hour, '5h' under a day, else '3d'"""
+    if age_sec < 3600:
+        return f"{age_sec // 60}m"
+    if age_sec < 86400:
+        return f"{age_sec // 3600}h"
+    return f"{age_sec // 86400}d"
+
+
+def _newest_halts_first(halts):
+    """(halt_id, halt_data) pairs, newest halt_time first - one cached key per halt"""
+    keyed = [
+        (_halt_sort_time(halt_data.get('halt_time', halt_data.get('timestamp', ''))), halt_id, halt_data)
+        for halt_id, halt_data in halts.items()
+    ]
+    keyed.sort(key=itemgetter(0), reverse=True)
+    return [(halt_id, halt_data) for _, halt_id, halt_data in keyed]
+
+
+@contextmanager
+def _batch(table):
+    """Suspend painting and sorting on a table while rows are written"""
+    table.setUpdatesEnabled(False)
+    sorting = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    try:
+        yield table
+    finally:
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+
+
+# Dark theme for the main window - one shared string, applied once per window
+_DARK_QSS = """
+    QMainWindow {
+        background-color: #000000;
+    }
+    QWidget {
+        background-color: #000000;
+        color: #c9d1d9;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 24px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #58a6ff;
+        background-color: #000000;
+    }
+    QTabBar {
+        qproperty-expanding: true;
+    }
+    QTabWidget::tab-bar {
+        alignment: center;
+    }
+    QTabBar::tab {
+        background-color: #000000;
+        color: #967bb6;
+        padding: 10px 25px;
+        margin-right: 2px;
+        border: 1px solid #58a6ff;
+        border-bottom: none;
+        font-size: 28px;
+        min-width: 150px;
+        min-height: 24px;
+    }
+    QTabBar::tab:selected {
+        background-color: #967bb6;
+        color: #000000;
+        font-weight: bold;
+    }
+    QTableView {
+        background-color: #000000;
+        alternate-background-color: #0d1117;
+        gridline-color: #58a6ff;
+        border: 1px solid #967bb6;
+    }
+    QTableView::item {
+        padding: 16px;
+        font-size: 24px;
+    }
+    QHeaderView::section {
+        background-color: #000000;
+        color: #58a6ff;
+        padding: 6px;
+        border: 1px solid #58a6ff;
+        font-weight: bold;
+        font-size: 24px;
+    }
+    QStatusBar {
+        background-color: #000000;
+        color: #967bb6;
+        border-top: 1px solid #58a6ff;
+    }
+    QLabel[session="PREMARKET"], QLabel[session="AFTERHOURS"] {
+        color: #ffaa00;
+    }
+    QLabel[session="OPEN"] {
+        color: #00ff00;
+    }
+    QLabel[session="CLOSED"], QLabel[session="WEEKEND"] {
+        color: #ff0000;
+    }
+    QLabel#indexLabel {
+        font-size: 13px;
+    }
+    QLabel#indexLabel[trend="up"] {
+        font-size: 20px;
+        color: #00ff00;
+    }
+    QLabel#indexLabel[trend="down"] {
+        font-size: 20px;
+        color: #ff0000;
+    }
+"""
+
+
+# NYC session boundaries in minutes since midnight (4:00, 9:30, 16:00, 20:00);
+# bisect_right(_SESSION_BOUNDS, minutes) indexes _SESSION_NAMES
+_SESSION_BOUNDS = (4 * 60, 9 * 60 + 30, 16 * 60, 20 * 60)
+_SESSION_NAMES = ("CLOSED", "PREMARKET", "OPEN", "AFTERHOURS", "CLOSED")
+
+
+class _WorkerSignals(QObject):
+    """Signals for the thread-pool workers (QRunnable can't emit on its own)"""
+    ready = pyqtSignal(object)  # Worker result
+
+
+class VaultRefreshWorker(QRunnable):
+    """
+    Runs the file I/O + parse + sort half of a vault refresh on the thread pool.
+    Every vault that needs it (news, halts) is prepared in one job, and the
+    results come back to the GUI thread in a single ready signal.
+    """
+    
+    def __init__(self, prepares, logger):
+        super().__init__()
+        self.prepares = prepares  # kind -> prepare callable
+        self.log = logger
+        self.signals = _WorkerSignals()
+    
+    def run(self):
+        results = {}
+        for kind, prepare in self.prepares.items():
+            try:
+                results[kind] = prepare()
+            except Exception as e:
+                self.log.crash(f"[GUI] Error preparing {kind} vault: {e}")
+                results[kind] = None
+        # Queued to the GUI thread, which owns the receiving window
+        self.signals.ready.emit(results)
+
+
+class IndicesWorker(QRunnable):
+    """Fetches the index proxy quotes on the thread pool (yfinance blocks on HTTP)"""
+    
+    SYMBOLS = ("SPY", "QQQ", "DIA")
+    
+    def __init__(self, logger):
+        super().__init__()
+        self.log = logger
+        self.signals = _WorkerSignals()
+    
+    def run(self):
+        quotes = {}  # symbol -> (price, change %)
+        try:
+            import yfinance as yf
+            # One download for all three symbols (fetched in parallel) instead of
+            # a round trip per ticker; the last two daily closes give the change
+            history = yf.download(
+                list(self.SYMBOLS), period="5d", interval="1d", group_by="ticker",
+                threads=True, progress=False, auto_adjust=False
+            )
+            for symbol in self.SYMBOLS:
+                closes = history[symbol]['Close'].dropna()
+                if closes.empty:
+                    continue
+                price = float(closes.iloc[-1])
+                prev_close = float(closes.iloc[-2]) if len(closes) > 1 else 0
+                change = (price - prev_close) / prev_close * 100 if prev_close else 0
+                quotes[symbol] = (price, change)
+        except Exception as e:
+            self.log.crash(f"[GUI] Error updating indices: {e}")
+        # Queued to the GUI thread, which owns the labels
+        self.signals.ready.emit(quotes)
 
 
 class SoundAlertManager:
     """Manages sound alerts for trading channels"""
     
+    # Minimum seconds between two plays of the same alert
+    MIN_REPLAY_INTERVAL = 0.25
+    
     def __init__(self, logger):
         self.log = logger
         self.sound_folder = "sounds"
         
-        # Load sound files
-        self.sounds = {
-            'morse_code': QSound(os.path.join(self.sound_folder, "morse_code_alert.wav")),
-            'news_flash': QSound(os.path.join(self.sound_folder, "iphone_news_flash.wav")),
-            'halt_resume': QSound(os.path.join(self.sound_folder, "halt_resume.wav")),
-            'nyse_bell': QSound(os.path.join(self.sound_folder, "nyse_bell.wav")),
-            'pregap': QSound(os.path.join(self.sound_folder, "woke_up_this_morning.wav"))
+        sound_files = {
+            'morse_code': "morse_code_alert.wav",
+            'news_flash': "iphone_news_flash.wav",
+            'halt_resume': "halt_resume.wav",
+            'nyse_bell': "nyse_bell.wav",
+            'pregap': "woke_up_this_morning.wav"
         }
+        
+        # Load sound files once - QSoundEffect keeps the decoded PCM in memory
+        self.sounds = {}
+        for name, filename in sound_files.items():
+            effect = QSoundEffect()
+            effect.setSource(QUrl.fromLocalFile(os.path.abspath(os.path.join(self.sound_folder, filename))))
+            effect.setVolume(0.8)
+            self.sounds[name] = effect
+        
+        self._last_played = {}
+        self._queued = set()  # Alerts deferred by play_sound_later, not yet played
         self.log.scanner("[SOUND] Alert system initialized")
     
     def play_sound(self, sound_name):
-        """Play a sound file"""
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
-            self.log.scanner(f"[SOUND] Playing {sound_name}")
-        else:
-            self.log.warning(f"[SOUND] Unknown sound: {sound_name}")
+        """Play a sound file (skipped if the same alert just played)"""
+        effect = self.sounds.get(sound_name)
+        if effect is None:
+            self.log.scanner(f"[SOUND] Unknown sound: {sound_name}")
+            return
+        
+        now = time.monotonic()
+        if now - self._last_played.get(sound_name, 0.0) < self.MIN_REPLAY_INTERVAL:
+            return
+        self._last_played[sound_name] = now
+        
+        effect.play()
+        self.log.scanner(f"[SOUND] Playing {sound_name}")
+    
+    def play_sound_later(self, sound_name):
+        """Play once control returns to the event loop (repeat requests meanwhile collapse)"""
+        if sound_name in self._queued:
+            return
+        self._queued.add(sound_name)
+        QTimer.singleShot(0, lambda: self._play_queued(sound_name))
+    
+    def _play_queued(self, sound_name):
+        self._queued.discard(sound_name)
+        self.play_sound(sound_name)
 
 class MainWindow(QMainWindow):
     """Main application window for SignalScan PRO"""
     
+    # Shared cell brushes - built once instead of per update
+    GREEN = QBrush(QColor(0, 255, 0))
+    RED = QBrush(QColor(255, 0, 0))
+    ORANGE = QBrush(QColor(255, 165, 0))
+    NEWS_BRUSH = QBrush(QColor(0, 100, 255))
+    
+    # Column widths (px) per channel tab
+    _COLUMN_WIDTHS = {
+        # Symbol, Price, Change%, Time, Age, Headline
+        "Breaking News": (150, 150, 150, 150, 100, 1450),
+        # Symbol, Status, Price, Reason, Halt Time, Resume Time
+        "Halts": (150, 300, 150, 200, 550, 550),
+        # Symbol, Price, Change%, Time, Gap%, Volume, RVOL, Float, News
+        "PreGap": (150, 150, 150, 150, 150, 250, 200, 200, 500),
+        # Symbol, Price, Change%, Time, HOD Price, Volume, RVOL, Float, News
+        "HOD": (150, 150, 150, 150, 150, 250, 200, 200, 500),
+        # Symbol, Price, Change%, Time, 5min%, Volume, RVOL, Float, News
+        "RunUP": (150, 150, 150, 150, 150, 250, 200, 200, 500),
+        # Symbol, Price, Change%, Time, Gap%, Volume, RVOL, News
+        "Reversal": (150, 150, 150, 150, 150, 250, 250, 650),
+        # Symbol, Price, Change%, Time, V-Score, MTF, Vol Quality, VWAP Dist, Signal
+        "Vector": (150, 150, 150, 150, 250, 250, 250, 250, 300),
+        # Symbol, Price, Change%, Time, Status, Intensity, Histogram, TF Align, Setup
+        "Squeeze": (150, 150, 150, 150, 250, 250, 250, 250, 300),
+        # Symbol, Price, Change%, Time, Trend STR, Model, Confidence, Direction, Signal
+        "Trend": (150, 150, 150, 150, 250, 250, 250, 250, 300),
+    }
+    
+    # stock_data keys shown per live channel, in column order
+    _PREGAP_COLS = ('symbol', 'price', 'change_pct', 'timestamp', 'gap_pct', 'volume', 'rvol', 'float', 'news')
+    _HOD_COLS = ('symbol', 'price', 'change_pct', 'timestamp', 'hod_price', 'volume', 'rvol', 'float', 'news')
+    _RUNUP_COLS = ('symbol', 'price', 'change_pct', 'timestamp', 'change_5min', 'volume', 'rvol', 'float', 'news')
+    _RVSL_COLS = ('symbol', 'price', 'change_pct', 'timestamp', 'gap_pct', 'volume', 'rvol', 'news')
+    
+    # Formatter method per stock_data key; other *pct*/*change* keys use
+    # _fmt_pct and everything else _fmt_default (see _column_plan)
+    _COL_FORMATTERS = {
+        'news': '_fmt_news',
+        'symbol': '_fmt_symbol',
+        'price': '_fmt_price',
+        'change_pct': '_fmt_change_pct',
+        'volume': '_fmt_volume',
+        'float': '_fmt_float',
+    }
+    
+    # (index proxy ETF, status label attribute, display name)
+    _INDEX_LABELS = (
+        ("SPY", "sp500_label", "S&P 500"),
+        ("QQQ", "nasdaq_label", "NASDAQ"),
+        ("DIA", "dow_label", "DOW"),
+    )
+    
+    # Logo search order - probed once, the scaled pixmap is shared by every window
+    _LOGO_PATHS = ("logo.jpeg", "logo.jpg", "logo.png", "assets/logo.jpeg", "assets/logo.png")
+    _LOGO_PIXMAP = None
+    _LOGO_PATH = None
+    _LOGO_PROBED = False
+    
+    # Seconds before vault tables are rebuilt even if their files are unchanged
+    VAULT_MAX_AGE = 60.0
+    
+    # Seconds between index quote fetches per market session (see _update_time);
+    # closed/weekend sessions poll at the idle interval
+    INDICES_INTERVALS = {"OPEN": 15.0, "PREMARKET": 60.0, "AFTERHOURS": 60.0}
+    INDICES_IDLE_INTERVAL = 300.0
+    
+    # Seconds between bkgnews.json change checks for the news index
+    NEWS_CACHE_TTL = 5.0
+    
+    # Buffered channels: (channel, apply method, alert sound played once per flush)
+    _CHANNEL_FLUSH = (
+        ('pregap', '_apply_pregap', 'pregap'),
+        ('hod', '_apply_hod', None),
+        ('runup', '_apply_runup', None),
+        ('reversal', '_apply_reversal', None),
+        ('vector', '_apply_vector', 'morse_code'),
+        ('squeeze', '_apply_squeeze', 'morse_code'),
+        ('trend', '_apply_trend', 'morse_code'),
+        ('news', '_apply_news', None),
+        ('halts', '_apply_halt', None),
+    )
+    
     def __init__(self, file_manager, logger, tier1=None, tier3=None, momo_vector=None, momo_squeeze=None, momo_trend=None):
         super().__init__()
         self.fm = file_manager
@@ -62,17 +434,87 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("SignalScan PRO - US Stock Market Scanner")
         self.setGeometry(50, 50, 500, 500)
         
+        # Thread hosting tier3's signal bridge (see connect_scanner_signals)
+        self._tier3_thread = None
+        
         # Initialize sound alert manager
         self.sound_alerts = SoundAlertManager(self.log)
-
+        
+        # Latest update per symbol for each live channel, applied by _flush_updates
+        self._pending = {channel: {} for channel, _, _ in self._CHANNEL_FLUSH}
+        
+        # Newest bkgnews item per symbol, rebuilt when bkgnews.json changes
+        # (file signature re-checked at most every NEWS_CACHE_TTL seconds)
+        self._news_by_symbol = {}
+        self._news_index_sig = None
+        self._news_index_checked_at = float('-inf')
+        
+        # Resolved column formatters per column tuple (see _column_plan)
+        self._column_plans = {}
+        
+        # (symbol, headline) pairs currently in the news table, for O(1) dedupe
+        self._news_seen = set()
+        
+        # Eastern time for the MOMO Time column, with formatted strings cached
+        # per raw timestamp (signals from one sync burst share timestamps)
+        self._est_tz = _EST
+        self._time_fmt_cache = {}
+        self._clock_minute = None  # Minute last shown by _update_time
+        self._market_session = None  # Session last shown by _update_time
+        
+        # Shared cell font (QFont needs the QApplication, so not a class constant)
+        self.BOLD_FONT = QFont("Arial", 10, QFont.Bold)
+        
         # Initialize UI
         self._init_ui()
         
-        # Set up vault refresh timer (update every 5 seconds for news/halts)
-        self.vault_refresh_timer = QTimer()
-        self.vault_refresh_timer.timeout.connect(self._refresh_vaults)
-        self.vault_refresh_timer.start(5000)  # 5000ms = 5 seconds
-        
+        # Vault refresh state (news/halts, checked every 5 seconds)
+        self._vault_mtimes = {}
+        self._vaults_refreshed_at = time.monotonic()
+        self._vault_job = None  # VaultRefreshWorker in flight
+        self._vault_pending = set()  # kinds requested while a job was in flight
+        self._indices_job = None  # IndicesWorker in flight
+        self._indices_fetched_at = float('-inf')
+        
+        # One 100ms tick drives every periodic job (see _on_tick)
+        self._tick = 0
+        self._tick_timer = QTimer(self)
+        self._tick_timer.timeout.connect(self._on_tick)
+        self._tick_timer.start(100)
+        
+        # Clock labels only show minutes - fire once per wall-clock minute
+        self._clock_timer = QTimer(self)
+        self._clock_timer.setSingleShot(True)
+        self._clock_timer.setTimerType(Qt.PreciseTimer)
+        self._clock_timer.timeout.connect(self._on_clock_minute)
+        self._schedule_clock()
+        
+        # First index fetch now rather than on a later tick - this also
+        # pays the cold yfinance import on the thread pool, so the NEWS button
+        # (MultiNewsAggregator imports yfinance) doesn't pay it on the GUI thread
+        self._update_indices()
+    
+    def _on_tick(self):
+        """
+        Shared 100ms timer:
+        - every tick: flush coalesced channel updates
+        - 5s: vault refresh, market indices (when due, see INDICES_INTERVALS)
+        """
+        self._tick += 1
+        self._flush_updates()
+        if self._tick % 50 == 0:
+            self._refresh_vaults()
+            self._update_indices()
+        
+    def _schedule_clock(self):
+        """Arm the clock timer for just after the next minute boundary"""
+        self._clock_timer.start(int((60 - time.time() % 60) * 1000) + 50)
+    
+    def _on_clock_minute(self):
+        """Minute rolled over: refresh the clock labels and re-arm"""
+        self._update_time()
+        self._schedule_clock()
+    
     def _init_ui(self):
         """Initialize the user interface"""
         self.log.scanner("[GUI-DEBUG] _init_ui started")
@@ -111,37 +553,43 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(self.rvsl_table, "Rvsl")
 
         self.vectortable = self._create_channel_tab("Vector", ["Symbol", "Price", "Change%", "Time", "V-Score", "MTF", "Vol Quality", "VWAP Dist", "Signal"])
-        idx = self.tabs.addTab(self.vectortable, "Vector")
-        self.tabs.setStyleSheet(self.tabs.styleSheet() + f"""
-            QTabBar::tab:nth-child({idx+1}) {{ background-color: #808080; color: #000000; }}
-            QTabBar::tab:nth-child({idx+1}):selected {{ background-color: #808080; color: #000000; font-weight: bold; }}
-        """)
+        momo_tabs = [self.tabs.addTab(self.vectortable, "Vector")]
 
         self.squeeze_table = self._create_channel_tab("Squeeze", ["Symbol", "Price", "Change%", "Time", "Status", "Intensity", "Histogram", "TF Align", "Setup"])
-        idx = self.tabs.addTab(self.squeeze_table, "Squeeze")
-        self.tabs.setStyleSheet(self.tabs.styleSheet() + f"""
-            QTabBar::tab:nth-child({idx+1}) {{ background-color: #808080; color: #000000; }}
-            QTabBar::tab:nth-child({idx+1}):selected {{ background-color: #808080; color: #000000; font-weight: bold; }}
-        """)
+        momo_tabs.append(self.tabs.addTab(self.squeeze_table, "Squeeze"))
 
         self.trend_table = self._create_channel_tab("Trend", ["Symbol", "Price", "Change%", "Time", "Trend STR", "Model", "Confidence", "Direction", "Signal"])
-        idx = self.tabs.addTab(self.trend_table, "Trend")
-        self.tabs.setStyleSheet(self.tabs.styleSheet() + f"""
+        momo_tabs.append(self.tabs.addTab(self.trend_table, "Trend"))
+        
+        # Grey MOMO tabs - one stylesheet for all three, parsed once
+        tab_css_parts = [self.tabs.styleSheet()]
+        for idx in momo_tabs:
+            tab_css_parts.append(f"""
             QTabBar::tab:nth-child({idx+1}) {{ background-color: #808080; color: #000000; }}
-            QTabBar::tab:nth-child({idx+1}):selected {{ background-color: #808080; color: #000000; font-weight: bold; }}
-        """)
+            QTabBar::tab:nth-child({idx+1}):selected {{ background-color: #808080; color: #000000; font-weight: bold; }}""")
+        self.tabs.setStyleSheet("\n".join(tab_css_parts))
         
         self.news_table = self._create_channel_tab("Breaking News", ["Symbol", "Price", "Change%", "Time", "Age", "Headline"])
+        # News rows are appended; the proxy keeps the newest on top
+        self.news_model = self.news_table.model()
+        self.news_table.setModel(NewestFirstProxy(self.news_model, self.news_table))
         self.tabs.addTab(self.news_table, "News")
 
         self.halt_table = self._create_channel_tab("Halts", ["Symbol", "Status", "Price", "Reason", "Halt Time", "Resume Time"])
         self.tabs.addTab(self.halt_table, "Halts")
         
-        # Connect cell click handlers for news popups
-        self.pregap_table.cellClicked.connect(self._on_cell_clicked)
-        self.hod_table.cellClicked.connect(self._on_cell_clicked)
-        self.runup_table.cellClicked.connect(self._on_cell_clicked)
-        self.rvsl_table.cellClicked.connect(self._on_cell_clicked)
+        # News column per channel table, looked up by the clicked table
+        self._news_col_by_table = {
+            self.pregap_table: self._PREGAP_COLS.index('news'),
+            self.hod_table: self._HOD_COLS.index('news'),
+            self.runup_table: self._RUNUP_COLS.index('news'),
+            self.rvsl_table: self._RVSL_COLS.index('news'),
+        }
+        
+        # Connect cell click handlers for news popups - one handler for every
+        # table in the map, so adding a news column is a one-line change
+        for table in self._news_col_by_table:
+            table.clicked.connect(self._on_cell_clicked)
 
         # Bottom status bar
         self.status_bar = QStatusBar()
@@ -151,6 +599,24 @@ class MainWindow(QMainWindow):
         # Apply dark theme styling
         self._apply_stylesheet()
         
+    def _load_logo(self):
+        """Scaled logo pixmap (or None), loaded from disk on the first call only"""
+        cls = MainWindow
+        if cls._LOGO_PROBED:
+            return cls._LOGO_PIXMAP
+        cls._LOGO_PROBED = True
+        
+        for logo_path in cls._LOGO_PATHS:
+            try:
+                logo_pixmap = QPixmap(logo_path)  # Null if the file is missing
+                if not logo_pixmap.isNull():
+                    cls._LOGO_PIXMAP = logo_pixmap.scaled(45, 45, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    cls._LOGO_PATH = logo_path
+                    break
+            except Exception as e:
+                self.log.crash(f"[GUI] Error loading logo from {logo_path}: {e}")
+        return cls._LOGO_PIXMAP
+    
     def _create_status_panel(self):
         """Create top status panel"""
         panel = QWidget()
@@ -165,32 +631,14 @@ class MainWindow(QMainWindow):
         left_section = QHBoxLayout()
         
         # Logo
-        logo_label = QLabel()
-        logo_paths = [
-            "logo.jpeg",
-            "logo.jpg",
-            "logo.png",
-            "assets/logo.jpeg",
-            "assets/logo.png"
-        ]
-        
-        logo_loaded = False
-        for logo_path in logo_paths:
-            if os.path.exists(logo_path):
-                try:
-                    logo_pixmap = QPixmap(logo_path)
-                    if not logo_pixmap.isNull():
-                        logo_pixmap = logo_pixmap.scaled(45, 45, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        logo_label.setPixmap(logo_pixmap)
-                        logo_label.setStyleSheet("margin-right: 12px;")
-                        left_section.addWidget(logo_label)
-                        logo_loaded = True
-                        self.log.scanner(f"[GUI] Logo loaded from: {logo_path}")
-                        break
-                except Exception as e:
-                    self.log.crash(f"[GUI] Error loading logo from {logo_path}: {e}")
-        
-        if not logo_loaded:
+        logo_pixmap = self._load_logo()
+        if logo_pixmap is not None:
+            logo_label = QLabel()
+            logo_label.setPixmap(logo_pixmap)
+            logo_label.setStyleSheet("margin-right: 12px;")
+            left_section.addWidget(logo_label)
+            self.log.scanner(f"[GUI] Logo loaded from: {MainWindow._LOGO_PATH}")
+        else:
             self.log.scanner("[GUI] No logo found - continuing without logo")
         
         title = QLabel("SignalScan PRO")
@@ -310,38 +758,31 @@ class MainWindow(QMainWindow):
         indices_row.addStretch()
         
         self.sp500_label = QLabel("S&P 500: --")
-        self.sp500_label.setStyleSheet("font-size: 13px; font-weight: bold; padding: 5px;")
+        self.sp500_label.setObjectName("indexLabel")
+        self.sp500_label.setStyleSheet("font-weight: bold; padding: 5px;")
         indices_row.addWidget(self.sp500_label)
         
         indices_row.addStretch()
         
         self.nasdaq_label = QLabel("NASDAQ: --")
-        self.nasdaq_label.setStyleSheet("font-size: 13px; font-weight: bold; padding: 5px;")
+        self.nasdaq_label.setObjectName("indexLabel")
+        self.nasdaq_label.setStyleSheet("font-weight: bold; padding: 5px;")
         indices_row.addWidget(self.nasdaq_label)
         
         indices_row.addStretch()
         
         self.dow_label = QLabel("DOW: --")
-        self.dow_label.setStyleSheet("font-size: 13px; font-weight: bold; padding: 5px;")
+        self.dow_label.setObjectName("indexLabel")
+        self.dow_label.setStyleSheet("font-weight: bold; padding: 5px;")
         indices_row.addWidget(self.dow_label)
         
         indices_row.addStretch()
         
         layout.addLayout(indices_row)
 
-        # Update time immediately
+        # Update time immediately (then every minute from _clock_timer)
         self._update_time()
         
-        # Time update timer
-        time_timer = QTimer(self)
-        time_timer.timeout.connect(self._update_time)
-        time_timer.start(1000)
-        
-        # Indices update timer (every 5 seconds)
-        indices_timer = QTimer(self)
-        indices_timer.timeout.connect(self._update_indices)
-        indices_timer.start(30000)
-        
         panel.setStyleSheet("background-color: #000000; padding: 10px;")
         return panel
     
@@ -351,545 +792,491 @@ class MainWindow(QMainWindow):
     
     def _update_time(self):
         """Update the time display (12-hour format, no date)"""
-        # Local time
-        local_time = datetime.now()
-        self.local_time_label.setText(f"Local: {local_time.strftime('%I:%M %p')}")
+        # Labels only show minutes - nothing to do until the minute rolls over
+        now_ts = time.time()
+        minute = int(now_ts // 60)
+        if minute == self._clock_minute:
+            return
+        self._clock_minute = minute
+        
+        # Local and NYC time both come from the one clock read above
+        local_time = datetime.fromtimestamp(now_ts)
+        self._set_label(self.local_time_label, f"Local: {local_time.strftime('%I:%M %p')}")
         
         # NYC time (ET)
-        nyc_tz = pytz.timezone('America/New_York')
-        nyc_time = datetime.now(nyc_tz)
-        self.nyc_time_label.setText(f"NYC: {nyc_time.strftime('%I:%M %p')}")
+        nyc_time = datetime.fromtimestamp(now_ts, self._est_tz)
+        self._set_label(self.nyc_time_label, f"NYC: {nyc_time.strftime('%I:%M %p')}")
         
         # Check if weekend (Saturday=5, Sunday=6)
         if nyc_time.weekday() in [5, 6]:
-            self.market_session.setText("Market: WEEKEND")
-            self.market_session.setStyleSheet("font-weight: bold; padding: 5px; color: #ff0000; font-size: 36px;")
-            return
-        
-        # Update market session based on NYC time
-        hour = nyc_time.hour
-        minute = nyc_time.minute
-        
-        if 4 <= hour < 9 or (hour == 9 and minute < 30):
-            self.market_session.setText("Market: PREMARKET")
-            self.market_session.setStyleSheet("font-weight: bold; padding: 5px; color: #ffaa00; font-size: 36px;")
-        elif (hour == 9 and minute >= 30) or (9 < hour < 16):
-            self.market_session.setText("Market: OPEN")
-            self.market_session.setStyleSheet("font-weight: bold; padding: 5px; color: #00ff00; font-size: 36px;")
-        elif 16 <= hour < 20:
-            self.market_session.setText("Market: AFTERHOURS")
-            self.market_session.setStyleSheet("font-weight: bold; padding: 5px; color: #ffaa00; font-size: 36px;")
+            session = "WEEKEND"
         else:
-            self.market_session.setText("Market: CLOSED")
-            self.market_session.setStyleSheet("font-weight: bold; padding: 5px; color: #ff0000; font-size: 36px;")
+            # Market session from NYC minutes since midnight
+            session = _SESSION_NAMES[bisect_right(_SESSION_BOUNDS, nyc_time.hour * 60 + nyc_time.minute)]
+        
+        # Session only changes a few times a day - skip the label otherwise
+        if session != self._market_session:
+            self._market_session = session
+            self.market_session.setText(f"Market: {session}")
+            # Colour comes from the QLabel[session=...] rules in _DARK_QSS
+            self._set_label_state(self.market_session, "session", session)
+    
+    @staticmethod
+    def _set_label_state(label, name, value):
+        """
+        Set a dynamic property matched by _DARK_QSS and re-polish the label,
+        so Qt re-matches the rules without parsing a new stylesheet
+        """
+        if label.property(name) == value:
+            return
+        label.setProperty(name, value)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+    
+    @staticmethod
+    def _set_label(label, text, style=None):
+        """setText/setStyleSheet only when the value actually changed (each one repaints)"""
+        if label.text() != text:
+            label.setText(text)
+        if style is not None and label.styleSheet() != style:
+            label.setStyleSheet(style)
     
     @pyqtSlot(dict)
     def on_pregap_update(self, stock_data):
-        """Receive PreGap channel update (LIVE ONLY)"""
+        """Receive PreGap channel update (LIVE ONLY) - applied on the next flush"""
         self.log.scanner(f"[GUI<-TIER3] Received PREGAP signal: {stock_data.get('symbol')}")
         self.log.scanner(f"[GUI-SLOT] OK PREGAP received: {stock_data.get('symbol')}")
-        self.sound_alerts.play_sound('pregap')
-        self._add_or_update_stock(self.pregap_table, stock_data, [
-            'symbol', 'price', 'change_pct', 'timestamp', 'gap_pct', 'volume', 'rvol', 'float', 'news'
-        ])
-    
-        symbol = stock_data.get('symbol')
-        row = self._find_row(self.pregap_table, symbol)
-        if row >= 0:
-            news_data = self._get_news_for_symbol(symbol)
-            if news_data:
-                news_item = QTableWidgetItem("📰 News")
-                news_item.setForeground(QColor(0, 100, 255))
-                news_item.setData(Qt.UserRole, news_data)
-                self.pregap_table.setItem(row, 8, news_item)
-            else:
-                self.pregap_table.setItem(row, 8, QTableWidgetItem("-"))
-
+        self._pending['pregap'][_symbol(stock_data)] = stock_data
+    
+    def _apply_pregap(self, stock_data):
+        """Write one PreGap update to its table"""
+        self._add_or_update_stock(self.pregap_table, stock_data, self._PREGAP_COLS)
+    
     @pyqtSlot(dict)
     def on_hod_update(self, stock_data):
-        """Receive HOD channel update (LIVE ONLY)"""
+        """Receive HOD channel update (LIVE ONLY) - applied on the next flush"""
         self.log.scanner(f"[GUI<-TIER3] Received HOD signal: {stock_data.get('symbol')}")
         self.log.scanner(f"[GUI-SLOT] OK HOD received: {stock_data.get('symbol')}")
-        self._add_or_update_stock(self.hod_table, stock_data, [
-            'symbol', 'price', 'change_pct', 'timestamp', 'hod_price', 'volume', 'rvol', 'float', 'news'
-        ])
-        
-        symbol = stock_data.get('symbol')
-        row = self._find_row(self.hod_table, symbol)
-        if row >= 0:
-            news_data = self._get_news_for_symbol(symbol)
-            if news_data:
-                news_item = QTableWidgetItem("📰 News")
-                news_item.setForeground(QColor(0, 100, 255))
-                news_item.setData(Qt.UserRole, news_data)
-                self.hod_table.setItem(row, 8, news_item)
-            else:
-                self.hod_table.setItem(row, 8, QTableWidgetItem("-"))
-
+        self._pending['hod'][_symbol(stock_data)] = stock_data
+    
+    def _apply_hod(self, stock_data):
+        """Write one HOD update to its table"""
+        self._add_or_update_stock(self.hod_table, stock_data, self._HOD_COLS)
+        
     @pyqtSlot(dict)
     def on_runup_update(self, stock_data):
-        """Receive RunUP channel update (LIVE ONLY)"""
+        """Receive RunUP channel update (LIVE ONLY) - applied on the next flush"""
         self.log.scanner(f"[GUI<-TIER3] Received RUNUP signal: {stock_data.get('symbol')}")
         self.log.scanner(f"[GUI-SLOT] OK RUNUP received: {stock_data.get('symbol')}")
-        self._add_or_update_stock(self.runup_table, stock_data, [
-            'symbol', 'price', 'change_pct', 'timestamp', 'change_5min', 'volume', 'rvol', 'float', 'news'
-        ])
-    
-        symbol = stock_data.get('symbol')
-        row = self._find_row(self.runup_table, symbol)
-        if row >= 0:
-            news_data = self._get_news_for_symbol(symbol)
-            if news_data:
-                news_item = QTableWidgetItem("📰 News")
-                news_item.setForeground(QColor(0, 100, 255))
-                news_item.setData(Qt.UserRole, news_data)
-                self.runup_table.setItem(row, 8, news_item)
-            else:
-                self.runup_table.setItem(row, 8, QTableWidgetItem("-"))
-
+        self._pending['runup'][_symbol(stock_data)] = stock_data
+    
+    def _apply_runup(self, stock_data):
+        """Write one RunUP update to its table"""
+        self._add_or_update_stock(self.runup_table, stock_data, self._RUNUP_COLS)
+    
     @pyqtSlot(dict)
     def on_reversal_update(self, stock_data):
-        """Receive Reversal channel update (LIVE ONLY)"""
+        """Receive Reversal channel update (LIVE ONLY) - applied on the next flush"""
         self.log.scanner(f"[GUI<-TIER3] Received REVERSAL signal: {stock_data.get('symbol')}")
         self.log.scanner(f"[GUI-SLOT] OK REVERSAL received: {stock_data.get('symbol')}")
-        self._add_or_update_stock(self.rvsl_table, stock_data, [
-            'symbol', 'price', 'change_pct', 'timestamp', 'gap_pct', 'volume', 'rvol', 'float', 'news'
-        ])
-    
-        symbol = stock_data.get('symbol')
-        row = self._find_row(self.rvsl_table, symbol)
-        if row >= 0:
-            news_data = self._get_news_for_symbol(symbol)
-            if news_data:
-                news_item = QTableWidgetItem("📰 News")
-                news_item.setForeground(QColor(0, 100, 255))
-                news_item.setData(Qt.UserRole, news_data)
-                self.rvsl_table.setItem(row, 7, news_item)  # Column 7 for Reversal
-            else:
-                self.rvsl_table.setItem(row, 7, QTableWidgetItem("-"))
-
+        self._pending['reversal'][_symbol(stock_data)] = stock_data
+    
+    def _apply_reversal(self, stock_data):
+        """Write one Reversal update to its table"""
+        self._add_or_update_stock(self.rvsl_table, stock_data, self._RVSL_COLS)
+    
     @pyqtSlot(dict)
     def on_vector_update(self, data):
-        """Handle MOMO Vector updates"""
-        try:
-            symbol = data.get("symbol", "N/A")
-            self.sound_alerts.play_sound('morse_code')
-            row = self.find_row(self.vectortable, symbol)
-            if row == -1:
-                row = self.vectortable.rowCount()
-                self.vectortable.insertRow(row)
-            
-            # Column 0: Symbol
-            self.vectortable.setItem(row, 0, QTableWidgetItem(symbol))
-            
-            # Column 1: Price
-            price = data.get("price", 0)
-            price_item = QTableWidgetItem(f"{price:.2f}")
-
-            # Column 2: Change%
-            changepct = 0
-            if self.tier3 and hasattr(self.tier3, 'livedata'):
-                livedata = self.tier3.livedata.get(symbol, {})
-                changepct = livedata.get("changepct", 0)
-
-            # Apply same color to both price and change
-            color = QColor(0, 255, 0) if changepct > 0 else QColor(255, 0, 0)
-            price_item.setForeground(color)
-            self.vectortable.setItem(row, 1, price_item)
-
-            change_item = QTableWidgetItem(f"{changepct:.2f}%")
-            change_item.setForeground(color)
-            self.vectortable.setItem(row, 2, change_item)
-            
-            # Column 3: Time
-            timestamp = data.get("timestamp", "")
-            try:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                est = pytz.timezone("US/Eastern")
-                dt_est = dt.astimezone(est)
-                time_display = dt_est.strftime("%I:%M%p").lower()
-                self.vectortable.setItem(row, 3, QTableWidgetItem(time_display))
-            except:
-                self.vectortable.setItem(row, 3, QTableWidgetItem("--"))
-            
-            # Column 4: V-Score
-            v_score = data.get("v_score", 0)
-            v_item = QTableWidgetItem(f"{v_score:.1f}")
-            v_item.setForeground(QColor(0, 255, 0) if v_score > 0 else QColor(255, 0, 0))
-            self.vectortable.setItem(row, 4, v_item)
-            
-            # Column 5: MTF
-            mtf = data.get("mtf_alignment", "")
-            self.vectortable.setItem(row, 5, QTableWidgetItem(mtf))
-            
-            # Column 6: Vol Quality
-            vol_quality = data.get("vol_quality", 0)
-            self.vectortable.setItem(row, 6, QTableWidgetItem(f"{vol_quality:.2f}"))
-            
-            # Column 7: VWAP Dist
-            vwap_dist = data.get("vwap_dist", 0)
-            self.vectortable.setItem(row, 7, QTableWidgetItem(f"{vwap_dist:.2f}σ"))
-            
-            # Column 8: Signal
-            signal = data.get("signal", "WATCH")
-            signal_item = QTableWidgetItem(signal)
-            signal_item.setFont(QFont("Arial", 10, QFont.Bold))
-            if "BUY" in signal:
-                signal_item.setForeground(QColor(0, 255, 0))
-            elif "SELL" in signal:
-                signal_item.setForeground(QColor(255, 0, 0))
-            self.vectortable.setItem(row, 8, signal_item)
-            
-        except Exception as e:
-            self.log.crash(f"[GUI] Error handling Vector update: {e}")
+        """Handle MOMO Vector updates - applied on the next flush"""
+        self._pending['vector'][_symbol(data) or "N/A"] = data
+    
+    def _apply_vector(self, data):
+        """Write one MOMO Vector update to its table"""
+        self._momo_update(self.vectortable, data, self._vector_tail, "Vector")
 
     @pyqtSlot(dict)
     def on_squeeze_update(self, data):
-        """Handle MOMO Squeeze updates"""
-        try:
-            symbol = data.get("symbol", "N/A")
-            self.sound_alerts.play_sound('morse_code')
-            row = self.find_row(self.squeezetable, symbol)
-            if row == -1:
-                row = self.squeezetable.rowCount()
-                self.squeezetable.insertRow(row)
-            
-            # Column 0: Symbol
-            self.squeezetable.setItem(row, 0, QTableWidgetItem(symbol))
-            
-            # Column 1: Price
-            price = data.get("price", 0)
-            price_item = QTableWidgetItem(f"{price:.2f}")
-
-            # Column 2: Change%
-            changepct = 0
-            if self.tier3 and hasattr(self.tier3, 'livedata'):
-                livedata = self.tier3.livedata.get(symbol, {})
-                changepct = livedata.get("changepct", 0)
-
-            # Apply same color to both price and change
-            color = QColor(0, 255, 0) if changepct > 0 else QColor(255, 0, 0)
-            price_item.setForeground(color)
-            self.squeezetable.setItem(row, 1, price_item)
-
-            change_item = QTableWidgetItem(f"{changepct:.2f}%")
-            change_item.setForeground(color)
-            self.squeezetable.setItem(row, 2, change_item)
-            
-            # Column 3: Time
-            timestamp = data.get("timestamp", "")
-            try:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                est = pytz.timezone("US/Eastern")
-                dt_est = dt.astimezone(est)
-                time_display = dt_est.strftime("%I:%M%p").lower()
-                self.squeezetable.setItem(row, 3, QTableWidgetItem(time_display))
-            except:
-                self.squeezetable.setItem(row, 3, QTableWidgetItem("--"))
-
-                        # Column 4: Status
-            status = data.get("status", "IDLE")
-            status_item = QTableWidgetItem(status)
-            if status == "COILING":
-                status_item.setForeground(QColor(255, 165, 0))
-            elif status == "FIRED":
-                status_item.setForeground(QColor(0, 255, 0))
-                status_item.setFont(QFont("Arial", 10, QFont.Bold))
-            self.squeezetable.setItem(row, 4, status_item)
-            
-            # Column 5: Intensity
-            intensity = data.get("intensity", 0)
-            self.squeezetable.setItem(row, 5, QTableWidgetItem(f"{intensity:.2f}"))
-            
-            # Column 6: Histogram
-            histogram = data.get("histogram", 0)
-            hist_item = QTableWidgetItem(f"{histogram:.3f}")
-            hist_item.setForeground(QColor(0, 255, 0) if histogram > 0 else QColor(255, 0, 0))
-            self.squeezetable.setItem(row, 6, hist_item)
-            
-            # Column 7: TF Align
-            self.squeezetable.setItem(row, 7, QTableWidgetItem("✓" if status == "FIRED" else "--"))
-            
-            # Column 8: Setup
-            setup = data.get("setup", "WAIT")
-            setup_item = QTableWidgetItem(setup)
-            setup_item.setFont(QFont("Arial", 10, QFont.Bold))
-            if "LONG" in setup:
-                setup_item.setForeground(QColor(0, 255, 0))
-            elif "SHORT" in setup:
-                setup_item.setForeground(QColor(255, 0, 0))
-            self.squeezetable.setItem(row, 8, setup_item)
-            
-        except Exception as e:
-            self.log.crash(f"[GUI] Error handling Squeeze update: {e}")
+        """Handle MOMO Squeeze updates - applied on the next flush"""
+        self._pending['squeeze'][_symbol(data) or "N/A"] = data
+    
+    def _apply_squeeze(self, data):
+        """Write one MOMO Squeeze update to its table"""
+        self._momo_update(self.squeeze_table, data, self._squeeze_tail, "Squeeze")
 
     @pyqtSlot(dict)
     def on_trend_update(self, data):
-        """Handle MOMO Trend updates"""
+        """Handle MOMO Trend updates - applied on the next flush"""
+        self._pending['trend'][_symbol(data) or "N/A"] = data
+    
+    def _apply_trend(self, data):
+        """Write one MOMO Trend update to its table"""
+        self._momo_update(self.trend_table, data, self._trend_tail, "Trend")
+
+    def _momo_update(self, table, data, tail, name):
+        """
+        Write one MOMO row: the shared Symbol/Price/Change%/Time columns,
+        then the channel-specific columns 4-8 from tail(data)
+        """
         try:
             symbol = data.get("symbol", "N/A")
-            self.sound_alerts.play_sound('morse_code')
-            row = self.find_row(self.trend_table, symbol)
-            if row == -1:
-                row = self.trend_table.rowCount()
-                self.trend_table.insertRow(row)
-            
-            # Column 0: Symbol
-            self.trend_table.setItem(row, 0, QTableWidgetItem(symbol))
             
             # Column 1: Price
             price = data.get("price", 0)
-            price_item = QTableWidgetItem(f"{price:.2f}")
-            
+
             # Column 2: Change%
-            changepct = 0
-            if self.tier3 and hasattr(self.tier3, 'livedata'):
-                livedata = self.tier3.livedata.get(symbol, {})
-                changepct = livedata.get("changepct", 0)
-            
+            tier3 = self.tier3
+            changepct = tier3.changepct_view.get(symbol, 0.0) if tier3 is not None else 0.0
+
             # Apply same color to both price and change
-            color = QColor(0, 255, 0) if changepct > 0 else QColor(255, 0, 0)
-            price_item.setForeground(color)
-            self.trend_table.setItem(row, 1, price_item)
-            
-            change_item = QTableWidgetItem(f"{changepct:.2f}%")
-            change_item.setForeground(color)
-            self.trend_table.setItem(row, 2, change_item)
+            color = self.GREEN if changepct > 0 else self.RED
             
             # Column 3: Time
-            timestamp = data.get("timestamp", "")
-            try:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                est = pytz.timezone("US/Eastern")
-                dt_est = dt.astimezone(est)
-                time_display = dt_est.strftime("%I:%M%p").lower()
-                self.trend_table.setItem(row, 3, QTableWidgetItem(time_display))
-            except:
-                self.trend_table.setItem(row, 3, QTableWidgetItem("--"))
-            
-            # Column 4: Trend STR (Strength)
-            trend_str = data.get("trend_strength", 0)
-            self.trend_table.setItem(row, 4, QTableWidgetItem(f"{trend_str:.2f}"))
-            
-            # Column 5: Model
-            model = data.get("model", "")
-            self.trend_table.setItem(row, 5, QTableWidgetItem(model))
-            
-            # Column 6: Confidence
-            confidence = data.get("confidence", 0)
-            self.trend_table.setItem(row, 6, QTableWidgetItem(f"{confidence:.1f}%"))
+            time_display = self._format_momo_time(data.get("timestamp", ""))
             
-            # Column 7: Direction
-            direction = data.get("direction", "NEUTRAL")
-            direction_item = QTableWidgetItem(direction)
-            if direction == "UP":
-                direction_item.setForeground(QColor(0, 255, 0))
-            elif direction == "DOWN":
-                direction_item.setForeground(QColor(255, 0, 0))
-            self.trend_table.setItem(row, 7, direction_item)
+            # Columns 4-8: channel specific
+            tail_texts, tail_fgs, tail_fonts = tail(data)
             
-            # Column 8: Signal
-            signal = data.get("signal", "WATCH")
-            signal_item = QTableWidgetItem(signal)
-            signal_item.setFont(QFont("Arial", 10, QFont.Bold))
-            if "BUY" in signal:
-                signal_item.setForeground(QColor(0, 255, 0))
-            elif "SELL" in signal:
-                signal_item.setForeground(QColor(255, 0, 0))
-            self.trend_table.setItem(row, 8, signal_item)
+            table.model().upsert(
+                symbol,
+                (symbol, PRICE_FMT(price), PCT_FMT(changepct), time_display, *tail_texts),
+                (None, color, color, None, *tail_fgs),
+                (None, None, None, None, *tail_fonts)
+            )
             
-        except Exception as e:
-            self.log.crash(f"[GUI] Error handling Trend update: {e}")
+        except (KeyError, TypeError) as e:
+            # Malformed payload only - anything else is a real bug and should surface
+            self.log.crash(f"[GUI] Bad {name} update for {data.get('symbol', 'N/A')}: {e}")
+
+    def _vector_tail(self, data):
+        """V-Score, MTF, Vol Quality, VWAP Dist, Signal"""
+        v_score = data.get("v_score", 0)
+        vol_quality = data.get("vol_quality", 0)
+        vwap_dist = data.get("vwap_dist", 0)
+        signal = data.get("signal", "WATCH")
+        
+        signal_color = None
+        if "BUY" in signal:
+            signal_color = self.GREEN
+        elif "SELL" in signal:
+            signal_color = self.RED
+        
+        return (
+            (SCORE_FMT(v_score), data.get("mtf_alignment", ""), PRICE_FMT(vol_quality), VWAP_FMT(vwap_dist), signal),
+            (self.GREEN if v_score > 0 else self.RED, None, None, None, signal_color),
+            (None, None, None, None, self.BOLD_FONT)
+        )
+
+    def _squeeze_tail(self, data):
+        """Status, Intensity, Histogram, TF Align, Setup"""
+        status = data.get("status", "IDLE")
+        intensity = data.get("intensity", 0)
+        histogram = data.get("histogram", 0)
+        setup = data.get("setup", "WAIT")
+        
+        status_color = None
+        status_font = None
+        if status == "COILING":
+            status_color = self.ORANGE
+        elif status == "FIRED":
+            status_color = self.GREEN
+            status_font = self.BOLD_FONT
+        
+        setup_color = None
+        if "LONG" in setup:
+            setup_color = self.GREEN
+        elif "SHORT" in setup:
+            setup_color = self.RED
+        
+        return (
+            (status, PRICE_FMT(intensity), HIST_FMT(histogram), "✓" if status == "FIRED" else "--", setup),
+            (status_color, None, self.GREEN if histogram > 0 else self.RED, None, setup_color),
+            (status_font, None, None, None, self.BOLD_FONT)
+        )
+
+    def _trend_tail(self, data):
+        """Trend STR, Model, Confidence, Direction, Signal"""
+        trend_str = data.get("trend_strength", 0)
+        confidence = data.get("confidence", 0)
+        direction = data.get("direction", "NEUTRAL")
+        signal = data.get("signal", "WATCH")
+        
+        direction_color = None
+        if direction == "UP":
+            direction_color = self.GREEN
+        elif direction == "DOWN":
+            direction_color = self.RED
+        
+        signal_color = None
+        if "BUY" in signal:
+            signal_color = self.GREEN
+        elif "SELL" in signal:
+            signal_color = self.RED
+        
+        return (
+            (PRICE_FMT(trend_str), data.get("model", ""), CONFIDENCE_FMT(confidence), direction, signal),
+            (None, None, None, direction_color, signal_color),
+            (None, None, None, None, self.BOLD_FONT)
+        )
 
     @pyqtSlot(dict)
     def on_news_update(self, news_data):
-        """Receive News update (VAULT + LIVE)"""
-        symbol = news_data.get('symbol', 'N/A')
+        """Receive live News update - applied on the next flush"""
+        key = (_symbol(news_data) or 'N/A', news_data.get('headline', 'No headline'))
+        self._pending['news'][key] = news_data
+    
+    def _apply_news(self, news_data):
+        """Add one live headline to the news table (skipped if already shown)"""
+        symbol = _symbol(news_data) or 'N/A'
         #self.sound_alerts.play_sound('news_flash')
         headline = news_data.get('headline', 'No headline')
         
         # Check if this exact headline already exists to avoid duplicates
-        for i in range(self.news_table.rowCount()):
-            if (self.news_table.item(i, 0) and 
-                self.news_table.item(i, 5) and  # Changed from 3 to 5 (Headline column)
-                self.news_table.item(i, 0).text() == symbol and
-                self.news_table.item(i, 5).text() == headline):
-                return  # Already exists, skip
-        
-        # Add new row at the top
-        row = 0
-        self.news_table.insertRow(row)
-        
-        # Column 0: Symbol
-        symbol_item = QTableWidgetItem(symbol)
-        self.news_table.setItem(row, 0, symbol_item)
+        key = (symbol, headline)
+        if key in self._news_seen:
+            return  # Already exists, skip
+        self._news_seen.add(key)
+        self._upsert_news_row(key, news_data)
+    
+    def _upsert_news_row(self, key, news_data):
+        """Write one news row (key = (symbol, headline)) - new rows are appended"""
+        # Appended rows are sorted into place by the proxy (payload = sort_time, newest on top)
+        self.news_model.upsert(key, *self._news_row(key, news_data))
+    
+    def _news_row(self, key, news_data):
+        """(texts, foregrounds, fonts, sort_time payload) for one news row"""
+        symbol, headline = key
         
         # Column 1: Price
         price = news_data.get('price', 0.0)
-        price_item = QTableWidgetItem(f"${price:.2f}" if isinstance(price, (int, float)) and price > 0 else "--")
+        price_text = DOLLAR_FMT(price) if isinstance(price, (int, float)) and price > 0 else "--"
 
         # Column 2: Change%
         change = news_data.get('change_pct', 0.0)
-        change_item = QTableWidgetItem(f"{change:+.2f}%" if isinstance(change, (int, float)) and change != 0 else "--")
+        change_text = SIGNED_PCT_FMT(change) if isinstance(change, (int, float)) and change != 0 else "--"
 
         # Apply same color to both price and change
+        color = None
         if isinstance(change, (int, float)):
-            color = QColor(0, 255, 0) if change > 0 else QColor(255, 0, 0)
-            price_item.setForeground(color)
-            change_item.setForeground(color)
-
-        self.news_table.setItem(row, 1, price_item)
-        self.news_table.setItem(row, 2, change_item)
+            color = self.GREEN if change > 0 else self.RED
         
         # Column 3: Time (Timestamp)
         timestamp = news_data.get('timestamp', 'N/A')
+        sort_time = 0.0
         # Format timestamp if it's a datetime string
         if isinstance(timestamp, str) and timestamp != 'N/A':
             try:
                 dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                sort_time = dt.timestamp()
                 timestamp = dt.strftime('%H:%M:%S')
             except:
                 pass
-        self.news_table.setItem(row, 3, QTableWidgetItem(str(timestamp)))
         
         # Column 4: Age
         age = news_data.get('age', 'N/A')
-        self.news_table.setItem(row, 4, QTableWidgetItem(str(age)))
         
-        # Column 5: Headline
-        self.news_table.setItem(row, 5, QTableWidgetItem(headline))
+        return (
+            (symbol, price_text, change_text, str(timestamp), str(age), headline),
+            (None, color, color, None, None, None),
+            None,
+            sort_time
+        )
 
 
     @pyqtSlot(dict)
     def on_halt_update(self, halt_data):
-        """Receive Halt update (VAULT + LIVE)"""
-        symbol = halt_data.get('symbol', 'N/A')
-        
-        # Find if symbol already exists
-        row = -1
-        for i in range(self.halt_table.rowCount()):
-            if self.halt_table.item(i, 0) and self.halt_table.item(i, 0).text() == symbol:
-                row = i
-                break
-        
-        # Add new row if not found
-        if row == -1:
-            row = self.halt_table.rowCount()
-            self.halt_table.insertRow(row)
+        """Receive live Halt update - applied on the next flush (latest per symbol)"""
+        self._pending['halts'][_symbol(halt_data) or 'N/A'] = halt_data
+    
+    def _apply_halt(self, halt_data):
+        """Write one halt row (VAULT + LIVE)"""
+        if halt_data.get('status') == "Resumed":
+            self.sound_alerts.play_sound_later('halt_resume')
         
-        # Column 0: Symbol
-        symbol_item = QTableWidgetItem(symbol)
-        self.halt_table.setItem(row, 0, symbol_item)
+        # Update existing row for this symbol, or append a new one
+        self.halt_table.model().upsert(*self._halt_row(halt_data))
+    
+    def _halt_row(self, halt_data):
+        """(symbol, texts, foregrounds) for one halt row"""
+        symbol = _symbol(halt_data) or 'N/A'
         
         # Column 1: Status
         status = halt_data.get('status', 'Unknown')
-        status_item = QTableWidgetItem(status)
+        status_color = None
         if status == "Halted":
-            status_item.setForeground(QColor(255, 0, 0))
+            status_color = self.RED
         elif status == "Resumed":
-            status_item.setForeground(QColor(0, 255, 0))
-            self.sound_alerts.play_sound('halt_resume')
-        self.halt_table.setItem(row, 1, status_item)
+            status_color = self.GREEN
         
         # Column 2: Price
         price = halt_data.get('price', 'N/A')
-        self.halt_table.setItem(row, 2, QTableWidgetItem(f"${price:.2f}" if isinstance(price, (int, float)) else str(price)))
+        price_text = DOLLAR_FMT(price) if isinstance(price, (int, float)) else str(price)
         
         # Column 3: Reason
-        self.halt_table.setItem(row, 3, QTableWidgetItem(str(halt_data.get('reason', 'N/A'))))
+        reason = str(halt_data.get('reason', 'N/A'))
         
         # Column 4: Halt Time
         halt_time = halt_data.get('halt_time', 'N/A')
         if isinstance(halt_time, str) and halt_time != 'N/A':
             try:
-                from dateutil import parser
-                import pytz
-                dt = parser.parse(halt_time)  # Parse any format
-                # Convert to EST
-                est = pytz.timezone('US/Eastern')
-                if dt.tzinfo is None:
-                    dt = pytz.utc.localize(dt)  # Assume UTC if no timezone
-                dt_est = dt.astimezone(est)
-                halt_time_display = dt_est.strftime('%I:%M%p - %a, %d %b').lower()  # 3:57pm - Tue, 11 Nov
+                halt_time_display = _fmt_halt_time(halt_time)  # 3:57pm - tue, 11 nov
             except Exception as e:
                 halt_time_display = halt_time  # Fallback to raw string
         else:
             halt_time_display = 'N/A'
-        self.halt_table.setItem(row, 4, QTableWidgetItem(halt_time_display))
         
         # Column 5: Resume Time
         resume_time = halt_data.get('resume_time', 'N/A')
         if isinstance(resume_time, str) and resume_time != 'N/A' and resume_time:
             try:
-                from dateutil import parser
-                dt = parser.parse(resume_time)  # Handles both ISO and RSS pubDate formats
-                resume_time_display = dt.strftime('%m/%d %H:%M')  # Shows: 11/11 11:45
+                resume_time_display = _fmt_resume_time(resume_time)  # Shows: 11/11 11:45
             except:
                 resume_time_display = resume_time
         else:
             resume_time_display = '-'  # Not resumed yet
-        self.halt_table.setItem(row, 5, QTableWidgetItem(resume_time_display))
+        
+        return (
+            symbol,
+            (symbol, status, price_text, reason, halt_time_display, resume_time_display),
+            (None, status_color, None, None, None, None)
+        )
 
-    def _add_or_update_stock(self, table, stock_data, columns):
-        """Add or update a stock in a table (for live trading channels)"""
-        symbol = stock_data.get('symbol', 'N/A')
-        
-        # Find if symbol already exists
-        row = -1
-        for i in range(table.rowCount()):
-            if table.item(i, 0) and table.item(i, 0).text() == symbol:
-                row = i
-                break
-        
-        # Add new row if not found
-        if row == -1:
-            row = table.rowCount()
-            table.insertRow(row)
-        
-        # Update each column
-        for col_idx, col_name in enumerate(columns):
-            value = stock_data.get(col_name, 'N/A')
+    def _format_momo_time(self, timestamp):
+        """ISO timestamp -> '09:41am' US/Eastern, '--' if unparseable"""
+        time_display = self._time_fmt_cache.get(timestamp)
+        if time_display is not None:
+            return time_display
+        
+        try:
+            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            time_display = dt.astimezone(self._est_tz).strftime("%I:%M%p").lower()
+        except (AttributeError, TypeError, ValueError):
+            time_display = "--"
+        
+        if len(self._time_fmt_cache) > 2048:
+            self._time_fmt_cache.clear()
+        self._time_fmt_cache[timestamp] = time_display
+        return time_display
+    
+    def _flush_updates(self):
+        """Apply buffered channel updates (latest per symbol) in one pass"""
+        for channel, apply_name, sound in self._CHANNEL_FLUSH:
+            pending = self._pending[channel]
+            if not pending:
+                continue
+            self._pending[channel] = {}
             
-            # Format the value
-            if col_name == 'symbol':
-                item = QTableWidgetItem(str(value))
-                item.setFont(QFont("Arial", 10, QFont.Bold))
-            elif col_name == 'price' and isinstance(value, (int, float)):
-                item = QTableWidgetItem(f"${value:.2f}")
-                # Apply color based on change_pct
-                change_pct = stock_data.get('change_pct', 0)
-                if isinstance(change_pct, (int, float)):
-                    if change_pct > 0:
-                        item.setForeground(QColor(0, 255, 0))
-                    elif change_pct < 0:
-                        item.setForeground(QColor(255, 0, 0))
-
-            elif 'pct' in col_name or 'change' in col_name:
-                if isinstance(value, (int, float)):
-                    item = QTableWidgetItem(f"{value:+.2f}%")
-                    if value > 0:
-                        item.setForeground(QColor(0, 255, 0))
-                    elif value < 0:
-                        item.setForeground(QColor(255, 0, 0))
-                else:
-                    item = QTableWidgetItem(str(value))
-            elif col_name == 'volume' and isinstance(value, (int, float)):
-                item = QTableWidgetItem(f"{int(value):,}")
-            elif col_name == 'float' and isinstance(value, (int, float)):
-                item = QTableWidgetItem(f"{value/1e6:.1f}M")
-            elif isinstance(value, float):
-                item = QTableWidgetItem(f"{value:.2f}")
-            else:
-                item = QTableWidgetItem(str(value))
+            # No _batch here - each upsert repaints only its own dirty row range
+            apply = getattr(self, apply_name)
+            for data in pending.values():
+                try:
+                    apply(data)
+                except Exception as e:
+                    self.log.crash(f"[GUI] Error applying {channel} update: {e}")
             
-            table.setItem(row, col_idx, item)
+            # One alert per channel per flush, not one per symbol
+            if sound:
+                self.sound_alerts.play_sound(sound)
     
-    def _find_row(self, table, symbol):
-        """Find row index for symbol in table"""
-        for i in range(table.rowCount()):
-            if table.item(i, 0) and table.item(i, 0).text() == symbol:
-                return i
-        return -1
+    def _add_or_update_stock(self, table, stock_data, columns):
+        """Add or update a stock in a table (for live trading channels)"""
+        symbol = _symbol(stock_data) or 'N/A'
+        formatters, has_news = self._column_plan(columns)
+        
+        # News cell links to the latest headline (opens popup on click);
+        # looked up first so _fmt_news sees the same (refreshed) index
+        news_data = self._get_news_for_symbol(symbol) if has_news else None
+        
+        texts = []
+        fgs = []
+        fonts = []
+        
+        # Price and Change% share one color, resolved once per row
+        change_fg = self._sign_brush(stock_data.get('change_pct', 0))
+        
+        # Format each column
+        for col_name, fmt in zip(columns, formatters):
+            text, fg, font = fmt(stock_data.get(col_name, 'N/A'), stock_data, change_fg)
+            texts.append(text)
+            fgs.append(fg)
+            fonts.append(font)
+        
+        return table.model().upsert(symbol, texts, fgs, fonts, payload=news_data)
+    
+    def _column_plan(self, columns):
+        """(formatter per column, has news column) - resolved once per column tuple"""
+        plan = self._column_plans.get(columns)
+        if plan is None:
+            formatters = []
+            for col_name in columns:
+                fmt = self._COL_FORMATTERS.get(col_name)
+                if fmt is None:
+                    fmt = '_fmt_pct' if ('pct' in col_name or 'change' in col_name) else '_fmt_default'
+                formatters.append(getattr(self, fmt))
+            plan = self._column_plans[columns] = (tuple(formatters), 'news' in columns)
+        return plan
+    
+    def _sign_brush(self, value):
+        """GREEN above zero, RED below, None at zero or for non-numbers"""
+        try:
+            if value > 0:
+                return self.GREEN
+            if value < 0:
+                return self.RED
+        except TypeError:
+            pass
+        return None
+    
+    # Column formatters: (value, stock_data, change_fg) -> (text, foreground, font)
+    
+    def _fmt_news(self, value, stock_data, change_fg):
+        # Most symbols have no news - a plain key test on the index, no refresh check
+        if _symbol(stock_data) in self._news_by_symbol:
+            return "📰 News", self.NEWS_BRUSH, None
+        return "-", None, None
+    
+    def _fmt_symbol(self, value, stock_data, change_fg):
+        return str(value), None, self.BOLD_FONT
+    
+    # Producers send numbers; anything else falls back to str() via the except
+    
+    def _fmt_price(self, value, stock_data, change_fg):
+        try:
+            text = DOLLAR_FMT(value)
+        except (TypeError, ValueError):
+            return str(value), None, None
+        # Color based on change_pct
+        return text, change_fg, None
+    
+    def _fmt_pct(self, value, stock_data, change_fg):
+        try:
+            text = SIGNED_PCT_FMT(value)
+        except (TypeError, ValueError):
+            return str(value), None, None
+        return text, self._sign_brush(value), None
+    
+    def _fmt_change_pct(self, value, stock_data, change_fg):
+        try:
+            return SIGNED_PCT_FMT(value), change_fg, None
+        except (TypeError, ValueError):
+            return str(value), None, None
+    
+    def _fmt_volume(self, value, stock_data, change_fg):
+        try:
+            return VOLUME_FMT(int(value)), None, None
+        except (TypeError, ValueError, OverflowError):
+            return str(value), None, None
+    
+    def _fmt_float(self, value, stock_data, change_fg):
+        try:
+            return MILLIONS_FMT(value / 1e6), None, None
+        except (TypeError, ValueError):
+            return str(value), None, None
+    
+    def _fmt_default(self, value, stock_data, change_fg):
+        if isinstance(value, float):
+            return PRICE_FMT(value), None, None
+        return str(value), None, None
     
     # =========================================================================
     # VAULT SYSTEM - News & Halts persistent storage
@@ -903,23 +1290,31 @@ class MainWindow(QMainWindow):
 
         # Store tier3 reference for price lookups
         self.tier3 = tier3
+        
+        # Drain tier3's signal queue on its own thread so emission never
+        # competes with painting; slots are reached via queued connections.
+        # A failure here must not skip the signal wiring below.
+        try:
+            self._start_tier3_thread(tier3)
+        except Exception as e:
+            self.log.crash(f"[GUI] Tier3 bridge thread not started, staying on the GUI thread: {e}")
 
         # Connect Tier3 channel signals (LIVE ONLY)
         if tier3 and hasattr(tier3, 'pregap_signal'):
-            tier3.pregap_signal.connect(self.on_pregap_update)
+            tier3.pregap_signal.connect(self.on_pregap_update, Qt.QueuedConnection)
             self.log.scanner("[GUI] OK PreGap feed connected (LIVE)")
         
         if tier3 and hasattr(tier3, 'hod_signal'):
-            tier3.hod_signal.connect(self.on_hod_update)
+            tier3.hod_signal.connect(self.on_hod_update, Qt.QueuedConnection)
             self.log.scanner("[GUI] OK HOD feed connected (LIVE)")
             self.log.scanner(f"[GUI-DEBUG] Signal check - HOD signal exists: {hasattr(tier3, 'hod_signal')}, Slot exists: {hasattr(self, 'on_hod_update')}")
 
         if tier3 and hasattr(tier3, 'runup_signal'):
-            tier3.runup_signal.connect(self.on_runup_update)
+            tier3.runup_signal.connect(self.on_runup_update, Qt.QueuedConnection)
             self.log.scanner("[GUI] OK RunUP feed connected (LIVE)")
         
         if tier3 and hasattr(tier3, 'reversal_signal'):
-            tier3.reversal_signal.connect(self.on_reversal_update)
+            tier3.reversal_signal.connect(self.on_reversal_update, Qt.QueuedConnection)
             self.log.scanner("[GUI] OK Reversal feed connected (LIVE)")
         
         # Connect MOMO signals
@@ -945,269 +1340,320 @@ class MainWindow(QMainWindow):
             halts.halt_signal.connect(self.on_halt_update)
             self.log.scanner("[GUI] OK Halt feed connected (VAULT + LIVE)")
         
-        # Load existing news and halts from vault on startup
-        self._load_existing_news()
-        self._load_existing_halts()
+        # Load existing news and halts from vault on startup (one background job)
+        self.log.scanner("[GUI] Loading news + halt vaults...")
+        self._submit_vault_refresh('news', 'halts')
     
-    def _load_existing_news(self):
-        """Load news vault on startup"""
-        try:
-            self.log.scanner("[GUI] Loading news vault...")
-            self._refresh_news_vault()
-        except Exception as e:
-            self.log.crash(f"[GUI] Error loading news vault: {e}")
+    def _start_tier3_thread(self, tier3):
+        """Move tier3 (and its queue-drain timer) onto a dedicated QThread"""
+        if tier3 is None or self._tier3_thread is not None:
+            return
+        # QObject.thread() explicitly - scanner objects may keep their own .thread attribute
+        if QObject.thread(tier3) is not QThread.currentThread():
+            return  # Already living on another thread
+        
+        self._tier3_thread = QThread(self)
+        tier3.moveToThread(self._tier3_thread)
+        signal_timer = getattr(tier3, 'signal_timer', None)
+        if signal_timer is not None:
+            signal_timer.moveToThread(self._tier3_thread)
+        self._tier3_thread.start()
+        self.log.scanner("[GUI] OK Tier3 signal bridge running on its own thread")
     
-    def _load_existing_halts(self):
-        """Load halt vault on startup"""
-        try:
-            self.log.scanner("[GUI] Loading halt vault...")
-            self._refresh_halt_vault()
-        except Exception as e:
-            self.log.crash(f"[GUI] Error loading halt vault: {e}")
+    def closeEvent(self, event):
+        """Stop the tier3 bridge thread before the window goes away"""
+        if self._tier3_thread is not None:
+            self._tier3_thread.quit()
+            self._tier3_thread.wait(2000)
+        super().closeEvent(event)
     
     def _refresh_vaults(self):
-        """Auto-refresh vaults every 5 seconds"""
-        self._refresh_news_vault()
-        self._refresh_halt_vault()
+        """Auto-refresh vaults every 5 seconds (only when their files changed)"""
+        now = time.monotonic()
+        # Ages and live prices still drift, so rebuild at least every VAULT_MAX_AGE
+        stale = now - self._vaults_refreshed_at >= self.VAULT_MAX_AGE
+        if stale:
+            self._vaults_refreshed_at = now
+        
+        kinds = []
+        if self._vault_changed('bkgnews', 'news') or stale:
+            kinds.append('news')
+        if self._vault_changed('active_halts', 'halts') or stale:
+            kinds.append('halts')
+        if kinds:
+            self._submit_vault_refresh(*kinds)
     
-    def _refresh_news_vault(self):
-        """Refresh news table from vault files (bkgnews.json + news.json), with breaking news age filter."""
-        try:
-            self.log.scanner("=" * 80)
-            self.log.scanner("[GUI-DEBUG] _refresh_news_vault() CALLED")
-            self.log.scanner("=" * 80)
-            
-            self.news_table.setRowCount(0)
-
-            # Load breaking news (bkgnews.json)
-            bkgnews = self.fm.load_bkgnews()
-            self.log.scanner(f"[GUI-DEBUG] Loaded bkgnews: {len(bkgnews)} items")
-            
-            # Load general news (news.json)
-            news = self.fm.load_news()
-            self.log.scanner(f"[GUI-DEBUG] Loaded news: {len(news)} items")
-
-            # Combine all news
-            all_news = {}
-            all_news.update(bkgnews)
-            #all_news.update(news)
-            self.log.scanner(f"[GUI-DEBUG] Combined news: {len(all_news)} items")
-            
-            if self.tier3 and hasattr(self.tier3, 'live_data'):
-                news_symbols = [item.get('symbol') for item in all_news.values()]
-                missing = [s for s in news_symbols if s not in self.tier3.live_data]
-                self.log.scanner(f"[GUI-DEBUG] News symbols MISSING from Tier3: {missing[:10]}")
-
+    def _vault_changed(self, *file_keys):
+        """True if any of the vault files changed since the last check"""
+        changed = False
+        for file_key in file_keys:
+            try:
+                mtime = os.stat(self.fm.get_file_path(file_key)).st_mtime_ns
+            except (OSError, TypeError):
+                mtime = None
+            if self._vault_mtimes.get(file_key) != mtime:
+                self._vault_mtimes[file_key] = mtime
+                changed = True
+        return changed
+    
+    def _submit_vault_refresh(self, *kinds):
+        """Run the load/parse/sort half of the given vault refreshes as one thread-pool job"""
+        if self._vault_job is not None:
+            # Previous refresh still running - rerun these kinds when it lands
+            self._vault_pending.update(kinds)
+            return
+        prepares = {
+            'news': self._prepare_news_rows,
+            'halts': self._prepare_halt_rows,
+        }
+        worker = VaultRefreshWorker({kind: prepares[kind] for kind in kinds}, self.log)
+        worker.signals.ready.connect(self._on_vault_rows)
+        self._vault_job = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    @pyqtSlot(object)
+    def _on_vault_rows(self, results):
+        """Apply rows prepared by a VaultRefreshWorker (GUI thread)"""
+        self._vault_job = None
+        for kind, prepared in results.items():
+            if prepared is None:
+                continue  # Worker failed and already logged it
+            try:
+                if kind == 'news':
+                    self._apply_news_rows(prepared)
+                else:
+                    self._apply_halt_rows(prepared)
+            except Exception as e:
+                self.log.crash(f"[GUI] Error applying {kind} vault rows: {e}")
+        
+        # Requests that arrived mid-job (changed files, NEWS button) run now
+        if self._vault_pending:
+            pending = self._vault_pending
+            self._vault_pending = set()
+            self._submit_vault_refresh(*(kind for kind in ('news', 'halts') if kind in pending))
+    
+    def _prepare_news_rows(self):
+        """
+        Load, age-filter and price the news vault (no Qt calls - safe off the GUI thread)
+        
+        Returns:
+            (gui rows, filtered breaking count, filtered general count)
+        """
+        # Load breaking news (bkgnews.json) - general news.json is not shown
+        all_news = self.fm.load_bkgnews(copy=False)  # Read-only
+        
+        if DEBUG_VAULT:
+            self.log.scanner(f"[GUI-DEBUG] Loaded bkgnews: {len(all_news)} items")
             if self.tier3 and hasattr(self.tier3, 'live_data'):
+                # Set difference against the live_data key view - no per-symbol Python loop
+                missing = {item.get('symbol') for item in all_news.values()} - self.tier3.live_data.keys()
                 self.log.scanner(f"[GUI-DEBUG] Tier3 has live_data for {len(self.tier3.live_data)} symbols")
-                self.log.scanner(f"[GUI-DEBUG] Tier3 live_data keys: {list(self.tier3.live_data.keys())[:20]}")  # Show first 20
-                # Check if news symbols are in there
-                news_symbols = [item.get('symbol') for item in all_news.values()]
-                subscribed_news = [s for s in news_symbols if s in self.tier3.live_data]
-                self.log.scanner(f"[GUI-DEBUG] News symbols subscribed to Tier3: {subscribed_news}")
+                self.log.scanner(f"[GUI-DEBUG] News symbols MISSING from Tier3: {sorted(missing, key=str)[:10]}")
             else:
-                self.log.scanner(f"[GUI-DEBUG] Tier3 live_data NOT AVAILABLE")
-
-            # Sort by timestamp - newest first (only showing breaking news)
-            sorted_news = sorted(
-                all_news.items(),
-                key=lambda x: x[1].get('timestamp', ''),
-                reverse=False  # Newest first
-            )
-
-            from datetime import timezone
-            now = datetime.now(timezone.utc)
-            self.log.scanner(f"[GUI-DEBUG] Current time (UTC): {now}")
-            
-            shown = 0
-            filtered_breaking = 0
-            filtered_general = 0
-            
-            for news_id, news_item in sorted_news:
-                # Calculate age
-                try:
-                    timestamp = datetime.fromisoformat(news_item['timestamp'].replace('Z', '+00:00'))
-                    age_hours = (now - timestamp).total_seconds() / 3600
-                    # Format age: minutes if < 1 hour, hours if < 24 hours, days otherwise
-                    if age_hours < 1:
-                        age_str = f"{int(age_hours * 60)}m"
-                    elif age_hours < 24:
-                        age_str = f"{int(age_hours)}h"
-                    else:
-                        age_str = f"{int(age_hours/24)}d"
-                    self.log.scanner(f"[GUI-DEBUG] {news_item.get('symbol')}: age={age_hours:.2f}h, category={news_item.get('category')}")
-                except Exception as e:
-                    self.log.scanner(f"[GUI-DEBUG] ERROR calculating age for {news_id}: {e}")
-                    age_hours = 999
-                    age_str = "N/A"
-
-                # Only show breaking news ≤2hr, general news ≤72hr
-                category = news_item.get('category', '')
-                if category == 'breaking' and age_hours > 2:
-                    filtered_breaking += 1
-                    self.log.scanner(f"[GUI-DEBUG] FILTERED OUT (breaking too old): {news_item.get('symbol')} - {age_hours:.2f}h")
-                    continue
-                if category == 'general' and age_hours > 72:
-                    filtered_general += 1
-                    self.log.scanner(f"[GUI-DEBUG] FILTERED OUT (general too old): {news_item.get('symbol')} - {age_hours:.2f}h")
-                    continue
-
-                self.log.scanner(f"[GUI-DEBUG] SHOWING: {news_item.get('symbol')} - {news_item.get('headline')[:50]}")
-
-                # Look up live price from tier3
-                price = 0.0
-                change_pct = 0.0
-                if self.tier3 and hasattr(self.tier3, 'live_data'):
-                    live = self.tier3.live_data.get(news_item.get('symbol'), {})
-                    price = live.get('price', 0.0)
-                    # Calculate %change if we have price
-                    if price > 0:
-                        # Try to get prev_close from tier3's tracking
-                        prev_close = self.tier3.prev_closes.get(news_item.get('symbol'), 0)
-                        if prev_close > 0:
-                            change_pct = ((price - prev_close) / prev_close) * 100
-
-                gui_data = {
-                    'symbol': news_item.get('symbol', 'N/A'),
-                    'price': price,
-                    'change_pct': change_pct,
-                    'headline': news_item.get('headline', 'No headline'),
-                    'age': age_str,
-                    'timestamp': news_item.get('timestamp', 'N/A')
-                }
-                self.on_news_update(gui_data)
-                shown += 1
-
-            self.log.scanner(f"[GUI-DEBUG] SUMMARY: shown={shown}, filtered_breaking={filtered_breaking}, filtered_general={filtered_general}")
-            self.log.scanner(f"[GUI] OK News vault loaded: {shown} fresh items")
+                self.log.scanner("[GUI-DEBUG] Tier3 live_data NOT AVAILABLE")
 
-        except Exception as e:
-            self.log.scanner(f"[GUI-DEBUG] EXCEPTION in _refresh_news_vault: {e}")
-            import traceback
-            self.log.scanner(traceback.format_exc())
-            self.log.crash(f"[GUI] Error refreshing news vault: {e}")
-    
-    def _refresh_halt_vault(self):
-        """Refresh halt table from vault files (active_halts.json + halts.json)"""
-        try:
-            self.log.scanner("=" * 80)
-            self.log.scanner("[GUI-DEBUG] _refresh_halt_vault() CALLED")
-            self.log.scanner("=" * 80)
-        
-            # Clear existing table
-            self.halt_table.setRowCount(0)
-        
-            # Load active halts (HALTED status)
-            active_halts = self.fm.load_active_halts()
-            self.log.scanner(f"[GUI-DEBUG] Loaded active_halts: {len(active_halts)} items")
+        now_ts = time.time()
+        breaking_max = 2 * 3600
+        general_max = 72 * 3600
         
-            # Load historical halts (RESUMED status)
-            historical_halts = self.fm.load_halts()
-            self.log.scanner(f"[GUI-DEBUG] Loaded historical_halts: {len(historical_halts)} items")
+        # Parse + age-filter in one pass, so only fresh items get sorted and priced
+        fresh = []
+        filtered_breaking = 0
+        filtered_general = 0
         
-            # Filter to last 72 hours only
-            from datetime import datetime, timedelta
-            cutoff_time = datetime.utcnow() - timedelta(hours=72)
+        for news_id, news_item in all_news.items():
+            # Calculate age (whole seconds)
+            try:
+                age_sec = max(0, int(now_ts - _parse_dt(news_item['timestamp']).timestamp()))
+            except Exception as e:
+                if DEBUG_VAULT:
+                    self.log.scanner(f"[GUI-DEBUG] ERROR calculating age for {news_id}: {e}")
+                age_sec = None
+
+            # Only show breaking news ≤2hr, general news ≤72hr
+            category = news_item.get('category', '')
+            if category == 'breaking' and (age_sec is None or age_sec > breaking_max):
+                filtered_breaking += 1
+                continue
+            if category == 'general' and (age_sec is None or age_sec > general_max):
+                filtered_general += 1
+                continue
+
+            fresh.append((news_item.get('timestamp', ''), age_sec, news_item))
+        
+        # Sort survivors by timestamp (the news proxy shows newest first)
+        fresh.sort(key=itemgetter(0))
+        
+        rows = []
+        live_data = self.tier3.live_data if self.tier3 and hasattr(self.tier3, 'live_data') else None
+        
+        for timestamp, age_sec, news_item in fresh:
+            # Look up live price from tier3
+            symbol = _symbol(news_item)
+            price = 0.0
+            change_pct = 0.0
+            if live_data is not None:
+                price = live_data.get(symbol, {}).get('price', 0.0)
+                # Calculate %change if we have price
+                if price > 0:
+                    # Try to get prev_close from tier3's tracking
+                    prev_close = self.tier3.prev_closes.get(symbol, 0)
+                    if prev_close > 0:
+                        change_pct = ((price - prev_close) / prev_close) * 100
+
+            rows.append({
+                'symbol': symbol or 'N/A',
+                'price': price,
+                'change_pct': change_pct,
+                'headline': news_item.get('headline', 'No headline'),
+                'age': "N/A" if age_sec is None else _age_str(age_sec),
+                'timestamp': news_item.get('timestamp', 'N/A')
+            })
+        
+        return rows, filtered_breaking, filtered_general
+    
+    def _apply_news_rows(self, prepared):
+        """Write prepared news rows, diffed against the rows already shown"""
+        rows, filtered_breaking, filtered_general = prepared
+        
+        shown_keys = set()
+        if not self.news_model.row_keys:
+            # First load: fill the model in one reset instead of a row insert per item
+            entries = []
+            for gui_data in rows:
+                key = (gui_data['symbol'], gui_data['headline'])
+                if key not in shown_keys:
+                    shown_keys.add(key)
+                    entries.append((key, *self._news_row(key, gui_data)))
+            self.news_model.reset_rows(entries)
+        else:
+            # Existing rows only repaint the cells that changed (age/price),
+            # expired ones are removed
+            with _batch(self.news_table):
+                for gui_data in rows:
+                    key = (gui_data['symbol'], gui_data['headline'])
+                    if key in shown_keys:
+                        continue
+                    shown_keys.add(key)
+                    self._upsert_news_row(key, gui_data)
+                
+                for key in self._news_seen - shown_keys:
+                    self.news_model.remove(key)
+        self._news_seen = shown_keys
+
+        self.log.scanner(
+            f"[GUI] OK News vault loaded: {len(shown_keys)} fresh items "
+            f"(filtered: {filtered_breaking} breaking, {filtered_general} general)"
+        )
+    
+    def _prepare_halt_rows(self):
+        """
+        Load, 72h-filter, sort and price the halt vaults (no Qt calls - safe off the GUI thread)
         
-            filtered_halts = {}
-            for halt_id, halt_data in historical_halts.items():
-                halt_time_str = halt_data.get('halt_time', halt_data.get('timestamp', ''))
-                try:
-                    from dateutil import parser
-                    halt_time = parser.parse(halt_time_str)
-                    if halt_time.replace(tzinfo=None) >= cutoff_time:
-                        filtered_halts[halt_id] = halt_data
-                except:
-                    # If can't parse time, keep it (fail-open)
+        Returns:
+            (halt rows in display order, active count, historical count, live-priced count)
+        """
+        # Load active halts (HALTED status)
+        active_halts = self.fm.load_active_halts()
+    
+        # Load historical halts (RESUMED status)
+        historical_halts = self.fm.load_halts()
+    
+        # Filter to last 72 hours only
+        cutoff_time = datetime.utcnow() - timedelta(hours=72)
+    
+        filtered_halts = {}
+        for halt_id, halt_data in historical_halts.items():
+            halt_time_str = halt_data.get('halt_time', halt_data.get('timestamp', ''))
+            try:
+                halt_time = _parse_dt(halt_time_str)
+                if halt_time.replace(tzinfo=None) >= cutoff_time:
                     filtered_halts[halt_id] = halt_data
-        
-            historical_halts = filtered_halts
-            self.log.scanner(f"[GUI-DEBUG] Filtered to last 72hrs: {len(historical_halts)} items")
-        
-            # Debug tier3 connection
+            except:
+                # If can't parse time, keep it (fail-open)
+                filtered_halts[halt_id] = halt_data
+    
+        if DEBUG_VAULT:
+            self.log.scanner(f"[GUI-DEBUG] Halts: {len(active_halts)} active, {len(historical_halts)} historical, {len(filtered_halts)} within 72hrs")
+        historical_halts = filtered_halts
+    
+        # Sort active and historical halts by halt_time (newest HALT first, not resume time)
+        sorted_active = _newest_halts_first(active_halts)
+        sorted_historical = _newest_halts_first(historical_halts)
+        
+        # Combine: active halts first (newest to oldest), then historical halts (newest to oldest).
+        # One row per symbol - the first (active) record wins, so the reset and
+        # upsert paths show the same row for a symbol that is in both vaults
+        rows = []
+        seen = set()
+        live_priced = 0
+        for halt_id, halt_data in sorted_active + sorted_historical:
+            symbol = _symbol(halt_data)
+            row_key = symbol or 'N/A'  # same key _halt_row gives the model
+            if row_key in seen:
+                continue
+            seen.add(row_key)
+        
+            # Look up live price from tier3 (stored price is the fallback)
             if self.tier3 and hasattr(self.tier3, 'live_data'):
-                self.log.scanner(f"[GUI-DEBUG] Tier3 has {len(self.tier3.live_data)} symbols with live data")
-            else:
-                self.log.scanner(f"[GUI-DEBUG] Tier3 live_data NOT AVAILABLE")
-        
-            # Helper function to convert time strings to sortable timestamps
-            def parse_time(time_str):
-                """Convert RSS pubDate or ISO timestamp to Unix timestamp for sorting"""
-                try:
-                    from dateutil import parser
-                    dt = parser.parse(time_str)
-                    return dt.timestamp()
-                except:
-                    return 0  # If parse fails, put at end
+                live = self.tier3.live_data.get(symbol, {})
+                prev_close = self.tier3.prev_closes.get(symbol, 0.0)
             
-            # Sort active halts by halt_time (newest first)
-            sorted_active = sorted(
-                active_halts.items(),
-                key=lambda x: parse_time(x[1].get('halt_time', x[1].get('timestamp', ''))),
-                reverse=True  # Newest halt first
-            )
+                # Get price data - Tier3 may return strings
+                live_price = live.get('price', 0.0)
+                bid = live.get('bid', 0.0)
+                ask = live.get('ask', 0.0)
             
-            # Sort historical halts by halt_time (newest HALT first, not resume time)
-            sorted_historical = sorted(
-                historical_halts.items(),
-                key=lambda x: parse_time(x[1].get('halt_time', x[1].get('timestamp', ''))),
-                reverse=True  # Newest halt first
-            )
+                # Convert all to float
+                try:
+                    live_price = float(live_price) if live_price else 0.0
+                    bid = float(bid) if bid else 0.0
+                    ask = float(ask) if ask else 0.0
+
+                except (ValueError, TypeError):
+                    bid = 0.0
+                    ask = 0.0
+                    live_price = (bid + ask) / 2 if bid and ask else 0.0
             
-            # Combine: active halts first (newest to oldest), then historical halts (newest to oldest)
-            combined_halts = sorted_active + sorted_historical
+                if live_price > 0:
+
+                    price = live_price
+                    change_pct = ((price - prev_close) / prev_close * 100) if prev_close > 0 else 0.0
+                    # Copy - vault records are shared with the FileManager cache
+                    halt_data = {
+                        **halt_data,
+                        'price': price,
+                        'prev_close': prev_close,
+                        'change_pct': change_pct
+                    }
+                    live_priced += 1
             
-            self.log.scanner(f"[GUI-DEBUG] Combined halt list: {len(sorted_active)} active + {len(sorted_historical)} historical (sorted by halt_time)")
+            rows.append(halt_data)
         
-            # Populate table with live price lookup
-            for halt_id, halt_data in combined_halts:
-                symbol = halt_data.get('symbol')
+        return rows, len(sorted_active), len(sorted_historical), live_priced
+    
+    def _apply_halt_rows(self, prepared):
+        """Write prepared halt rows in place; halts that dropped out of the vaults are removed"""
+        rows, active_count, historical_count, live_priced = prepared
+        
+        halt_model = self.halt_table.model()
+        if not halt_model.row_keys:
+            # First load: fill the model in one reset instead of a row insert per halt
+            halt_model.reset_rows((*self._halt_row(halt_data), None, None) for halt_data in rows)
+            if any(halt_data.get('status') == "Resumed" for halt_data in rows):
+                self.sound_alerts.play_sound_later('halt_resume')
+        else:
+            shown_symbols = set()
+            with _batch(self.halt_table):
+                for halt_data in rows:
+                    self._apply_halt(halt_data)
+                    shown_symbols.add(_symbol(halt_data) or 'N/A')
                 
-                # Look up live price from tier3
-                price = halt_data.get('price', 0.0)  # Use stored price as fallback
-            
-                if self.tier3 and hasattr(self.tier3, 'live_data'):
-                    live = self.tier3.live_data.get(symbol, {})
-                    prev_close = self.tier3.prev_closes.get(symbol, 0.0)
-                    
-                    # Get price data - Tier3 may return strings
-                    live_price = live.get('price', 0.0)
-                    bid = live.get('bid', 0.0)
-                    ask = live.get('ask', 0.0)
-                    
-                    # Convert all to float
-                    try:
-                        live_price = float(live_price) if live_price else 0.0
-                        bid = float(bid) if bid else 0.0
-                        ask = float(ask) if ask else 0.0
-
-                    except (ValueError, TypeError):
-                        bid = 0.0
-                        ask = 0.0
-                        live_price = (bid + ask) / 2 if bid and ask else 0.0
-                    
-                    if live_price > 0:
-
-                        price = live_price
-                        change_pct = ((price - prev_close) / prev_close * 100) if prev_close > 0 else 0.0
-                        halt_data['price'] = price
-                        halt_data['prev_close'] = prev_close
-                        halt_data['change_pct'] = change_pct
-                        self.log.scanner(f"[GUI-DEBUG] Updated {symbol} halt price from Tier3: ${price:.2f} ({change_pct:+.2f}%)")
-                    else:
-                        self.log.scanner(f"[GUI-DEBUG] No Tier3 price data for {symbol}")
-            
-                # Send to table display
-                self.on_halt_update(halt_data)
-        
-            if len(combined_halts) > 0:
-                self.log.scanner(f"[GUI] OK Halt vault refreshed: {len(combined_halts)} items ({len(sorted_active)} active, {len(sorted_historical)} historical)")
+                for symbol in [key for key in halt_model.row_keys if key not in shown_symbols]:
+                    halt_model.remove(symbol)
         
-        except Exception as e:
-            self.log.scanner(f"[GUI-DEBUG] EXCEPTION in _refresh_halt_vault: {e}")
-            import traceback
-            self.log.scanner(traceback.format_exc())
-            self.log.crash(f"[GUI] Error refreshing halt vault: {e}")
+        if rows:
+            self.log.scanner(f"[GUI] OK Halt vault refreshed: {len(rows)} items ({active_count} active, {historical_count} historical, {live_priced} live-priced)")
 
     # =========================================================================
     # Button Handlers
@@ -1220,10 +1666,7 @@ class MainWindow(QMainWindow):
         # Gather symbols from all active channels
         active_symbols = set()
         for table in [self.pregap_table, self.hod_table, self.runup_table, self.rvsl_table]:
-            for row in range(table.rowCount()):
-                symbol_item = table.item(row, 0)
-                if symbol_item:
-                    active_symbols.add(symbol_item.text())
+            active_symbols.update(table.model().row_keys)
         
         if not active_symbols:
             self.log.scanner("[GUI] No active symbols in channels, using default list")
@@ -1242,7 +1685,7 @@ class MainWindow(QMainWindow):
         self.fm.save_news(vault_news)
         
         # Refresh the news table display
-        self._refresh_news_vault()
+        self._submit_vault_refresh('news')
         
         # Switch to News tab
         self.tabs.setCurrentIndex(4)
@@ -1253,7 +1696,6 @@ class MainWindow(QMainWindow):
         self.log.scanner("[GUI] UPDATE button clicked - Background refresh initiated...")
         
         # Run refresh in background thread to keep UI responsive
-        from threading import Thread
         refresh_thread = Thread(target=self._background_nuclear_refresh, daemon=True)
         refresh_thread.start()
         
@@ -1293,7 +1735,6 @@ class MainWindow(QMainWindow):
             
         except Exception as e:
             self.log.scanner(f"[BACKGROUND-REFRESH] ERROR: {e}")
-            import traceback
             self.log.scanner(traceback.format_exc())
 
     def _on_kiosk_clicked(self):
@@ -1308,82 +1749,32 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Entered Kiosk mode (press ESC to exit)")
         
     def _create_channel_tab(self, channel_name, columns):
-        """Create a table widget for a channel"""
-        table = QTableWidget()
-        table.setColumnCount(len(columns))
-        table.setHorizontalHeaderLabels(columns)
+        """Create a table view (backed by a ChannelModel) for a channel"""
+        table = QTableView()
+        table.setModel(ChannelModel(columns, table))
         
         # Table styling
         table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectRows)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         table.verticalHeader().setVisible(False)
-        
-        # Set specific column widths
+        # Fixed row heights - Qt never measures row contents
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # Rows are one line high, so wrapped text would be clipped anyway -
+        # single-line layout (elided) is cheaper to paint
+        table.setWordWrap(False)
+        
+        # Set specific column widths - known up front, so Qt never has to
+        # stringify rows to size a column
         header = table.horizontalHeader()
-
-        if channel_name == "Breaking News":
-            # Symbol, Price, Change%, Time, Age, Headline
-            widths = [150, 150, 150, 150, 100, 1450]
-            for i, width in enumerate(widths):
-                header.setSectionResizeMode(i, QHeaderView.Fixed)
-                table.setColumnWidth(i, width)
-                
-        elif channel_name == "Halts":
-            # Symbol, Status, Halt Time, Resume Time, Reason, Price
-            widths = [150, 300, 150, 200, 550, 550]
-            for i, width in enumerate(widths):
-                header.setSectionResizeMode(i, QHeaderView.Fixed)
-                table.setColumnWidth(i, width)
-                
-        elif channel_name == "PreGap":
-            # Symbol, Price, Change%, Time, Gap%, Volume, RVOL, Float, News
-            widths = [150, 150, 150, 150, 150, 250, 200, 200, 500]
-            for i, width in enumerate(widths):
-                header.setSectionResizeMode(i, QHeaderView.Fixed)
-                table.setColumnWidth(i, width)
-                
-        elif channel_name == "HOD":
-            # Symbol, Price, Change%, Time, HOD Price, Volume, RVOL, Float, News
-            widths = [150, 150, 150, 150, 150, 250, 200, 200, 500]
-            for i, width in enumerate(widths):
-                header.setSectionResizeMode(i, QHeaderView.Fixed)
-                table.setColumnWidth(i, width)
-                
-        elif channel_name == "RunUP":
-            # Symbol, Price, Change%, Time, 5min%, Volume, RVOL, Float, News
-            widths = [150, 150, 150, 150, 150, 250, 200, 200, 500]
-            for i, width in enumerate(widths):
-                header.setSectionResizeMode(i, QHeaderView.Fixed)
-                table.setColumnWidth(i, width)
-                
-        elif channel_name == "Reversal":
-            # Symbol, Price, Change%, time, Gap%, Volume, RVOL, News
-            widths = [150, 150, 150, 150, 150, 250, 250, 650]
-            for i, width in enumerate(widths):
-                header.setSectionResizeMode(i, QHeaderView.Fixed)
-                table.setColumnWidth(i, width)
-
-        elif channel_name == "Vector":
-        # Symbol, Price, Change%, Time, V-Score, MTF, Vol Quality, VWAP Dist, Signal
-            widths = [150, 150, 150, 150, 250, 250, 250, 250, 300]
-            for i, width in enumerate(widths):
-                header.setSectionResizeMode(i, QHeaderView.Fixed)
-                table.setColumnWidth(i, width)
-
-        elif channel_name == "Squeeze":
-            # Symbol, Price, Change%, Time, Status, Intensity, Histogram, TF Align, Setup
-            widths = [150, 150, 150, 150, 250, 250, 250, 250, 300]
-            for i, width in enumerate(widths):
-                header.setSectionResizeMode(i, QHeaderView.Fixed)
-                table.setColumnWidth(i, width)
-
-        elif channel_name == "Trend":
-        # Symbol, Price, Change%, Time, Trend STR, Model, Confidence, Direction, Signal
-            widths = [150, 150, 150, 150, 250, 250, 250, 250, 300]
-            for i, width in enumerate(widths):
-                header.setSectionResizeMode(i, QHeaderView.Fixed)
-                table.setColumnWidth(i, width)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        resize_section = header.resizeSection
+        for i, width in enumerate(self._COLUMN_WIDTHS.get(channel_name, ())):
+            resize_section(i, width)
+        
+        # Headline column stays fixed
+        if "Headline" in columns:
+            header.setSectionResizeMode(columns.index("Headline"), QHeaderView.Fixed)
 
         return table
         
@@ -1448,85 +1839,81 @@ class MainWindow(QMainWindow):
         return (False, None)
     
     def _update_indices(self):
-        """Update market indices (S&P 500, NASDAQ, DOW)"""
-        try:
-            import yfinance as yf
-            
-            # S&P 500 (SPY ETF as proxy)
-            spy = yf.Ticker("SPY")
-            spy_price = spy.info.get('regularMarketPrice', spy.info.get('currentPrice', 0))
-            spy_change = spy.info.get('regularMarketChangePercent', 0)
-            
-            # NASDAQ (QQQ ETF as proxy)
-            qqq = yf.Ticker("QQQ")
-            qqq_price = qqq.info.get('regularMarketPrice', qqq.info.get('currentPrice', 0))
-            qqq_change = qqq.info.get('regularMarketChangePercent', 0)
-            
-            # DOW (DIA ETF as proxy)
-            dia = yf.Ticker("DIA")
-            dia_price = dia.info.get('regularMarketPrice', dia.info.get('currentPrice', 0))
-            dia_change = dia.info.get('regularMarketChangePercent', 0)
-            
-            # Update S&P 500
-            sp500_color = "#00ff00" if spy_change >= 0 else "#ff0000"
-            self.sp500_label.setText(f"S&P 500: ${spy_price:.2f} ({spy_change:+.2f}%)")
-            self.sp500_label.setStyleSheet(f"font-size: 20px; font-weight: bold; padding: 5px; color: {sp500_color};")
-            
-            # Update NASDAQ
-            nasdaq_color = "#00ff00" if qqq_change >= 0 else "#ff0000"
-            self.nasdaq_label.setText(f"NASDAQ: ${qqq_price:.2f} ({qqq_change:+.2f}%)")
-            self.nasdaq_label.setStyleSheet(f"font-size: 20px; font-weight: bold; padding: 5px; color: {nasdaq_color};")
-            
-            # Update DOW
-            dow_color = "#00ff00" if dia_change >= 0 else "#ff0000"
-            self.dow_label.setText(f"DOW: ${dia_price:.2f} ({dia_change:+.2f}%)")
-            self.dow_label.setStyleSheet(f"font-size: 20px; font-weight: bold; padding: 5px; color: {dow_color};")
-            
-        except Exception as e:
-            self.log.crash(f"[GUI] Error updating indices: {e}")
+        """Update market indices (S&P 500, NASDAQ, DOW) - fetched on the thread pool"""
+        if self._indices_job is not None:
+            return  # Previous fetch still waiting on the network
+        now = time.monotonic()
+        interval = self.INDICES_INTERVALS.get(self._market_session, self.INDICES_IDLE_INTERVAL)
+        if now - self._indices_fetched_at < interval:
+            return
+        self._indices_fetched_at = now
+        worker = IndicesWorker(self.log)
+        worker.signals.ready.connect(self._on_indices)
+        self._indices_job = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    @pyqtSlot(object)
+    def _on_indices(self, quotes):
+        """Show quotes fetched by IndicesWorker (GUI thread)"""
+        self._indices_job = None
+        for symbol, label_name, title in self._INDEX_LABELS:
+            if symbol not in quotes:
+                continue
+            try:
+                price, change = quotes[symbol]
+                label = getattr(self, label_name)
+                self._set_label(label, f"{title}: ${price:.2f} ({change:+.2f}%)")
+                # Size/colour come from the QLabel#indexLabel rules in _DARK_QSS
+                self._set_label_state(label, "trend", "up" if change >= 0 else "down")
+            except Exception as e:
+                self.log.crash(f"[GUI] Error updating indices: {e}")
 
     def _get_news_for_symbol(self, symbol):
-        """Look up most recent news for symbol from bkgnews.json"""
+        """Most recent news for symbol (None if it has none)"""
+        now = time.monotonic()
+        if now - self._news_index_checked_at >= self.NEWS_CACHE_TTL:
+            self._news_index_checked_at = now
+            self._refresh_news_index()
+        return self._news_by_symbol.get(symbol)
+    
+    def _refresh_news_index(self):
+        """Rebuild the symbol -> newest news index if bkgnews.json changed"""
         try:
-            all_news = self.fm.load_breaking_news()
-            
-            # Find news matching this symbol (most recent first)
-            symbol_news = []
-            for news_id, news_data in all_news.items():
-                if news_data.get('symbol') == symbol:
-                    symbol_news.append(news_data)
-            
-            if symbol_news:
-                return symbol_news[0]
+            st = os.stat(self.fm.get_file_path('bkgnews'))
+            signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except (OSError, TypeError):
+            signature = None
+        if signature == self._news_index_sig:
+            return
+        
+        try:
+            all_news = self.fm.load_bkgnews(copy=False)  # Read-only
         except Exception as e:
-            self.log.scanner(f"[GUI] Error loading news for {symbol}: {e}")
+            self.log.scanner(f"[GUI] Error loading news index: {e}")
+            return
         
-        return None
+        # One pass over the vault, keeping the newest item per symbol
+        news_by_symbol = {}
+        for news_data in all_news.values():
+            symbol = _symbol(news_data)
+            current = news_by_symbol.get(symbol)
+            if current is None or news_data.get('timestamp', '') > current.get('timestamp', ''):
+                news_by_symbol[symbol] = news_data
+        
+        self._news_by_symbol = news_by_symbol
+        self._news_index_sig = signature
 
-    def _on_cell_clicked(self, row, col):
+    def _on_cell_clicked(self, index):
         """Handle cell clicks - open news popup if News column clicked"""
         sender = self.sender()
         
-        # Determine which table and news column index
-        news_col = None
-        if sender == self.pregap_table:
-            news_col = 8
-        elif sender == self.hod_table:
-            news_col = 8
-        elif sender == self.runup_table:
-            news_col = 8
-        elif sender == self.rvsl_table:
-            news_col = 7
-        
         # Check if News column was clicked
-        if col == news_col:
-            item = sender.item(row, col)
-            if item:
-                news_data = item.data(Qt.UserRole)
-                if news_data:
-                    from gui.news_popup import NewsPopup
-                    popup = NewsPopup(news_data, self)
-                    popup.exec_()
+        if index.column() != self._news_col_by_table.get(sender):
+            return
+        news_data = sender.model().payload(index.row())
+        if news_data:
+            popup = NewsPopup(news_data, self)
+            popup.exec_()
 
     def keyPressEvent(self, event):
         """Handle keyboard events"""
@@ -1536,82 +1923,5 @@ class MainWindow(QMainWindow):
             
     def _apply_stylesheet(self):
         """Apply dark theme stylesheet to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #000000;
-            }
-            QWidget {
-                background-color: #000000;
-                color: #c9d1d9;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 24px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #58a6ff;
-                background-color: #000000;
-            }
-            QTabBar {
-                qproperty-expanding: true;
-            }
-            QTabWidget::tab-bar {
-                alignment: center;
-            }
-            QTabBar::tab {
-                background-color: #000000;
-                color: #967bb6;
-                padding: 10px 25px;
-                margin-right: 2px;
-                border: 1px solid #58a6ff;
-                border-bottom: none;
-                font-size: 28px;
-                min-width: 150px;
-                min-height: 24px;
-            }
-            QTabBar::tab:selected {
-                background-color: #967bb6;
-                color: #000000;
-                font-weight: bold;
-            }
-            QTableWidget {
-                background-color: #000000;
-                alternate-background-color: #0d1117;
-                gridline-color: #58a6ff;
-                border: 1px solid #967bb6;
-            }
-            QTableWidget::item {
-                padding: 16px;
-                font-size: 24px;
-            }
-            QHeaderView::section {
-                background-color: #000000;
-                color: #58a6ff;
-                padding: 6px;
-                border: 1px solid #58a6ff;
-                font-weight: bold;
-                font-size: 24px;
-            }
-            QStatusBar {
-                background-color: #000000;
-                color: #967bb6;
-                border-top: 1px solid #58a6ff;
-            }
-        """)
-    
-    def _format_time_est(self, timestamp_str):
-        """Format timestamp to 12h EST time (HH:MM AM/PM)"""
-        try:
-            # Parse timestamp (assuming ISO format)
-            if isinstance(timestamp_str, str):
-                dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            else:
-                return "--"
-            
-            # Convert to EST
-            est_tz = pytz.timezone('America/New_York')
-            dt_est = dt.astimezone(est_tz)
-            
-            # Format as 12h time (HH:MM AM/PM)
-            return dt_est.strftime('%I:%M %p')
-        except Exception as e:
-            return "--"
+        self.setStyleSheet(_DARK_QSS)
 
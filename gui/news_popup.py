@@ -14,6 +14,9 @@ import webbrowser
 class NewsPopup(QDialog):
     """Popup dialog to display news article details"""
     
+    # Label fonts, built on the first popup (QFont needs the QApplication)
+    _FONTS = None
+    
     def __init__(self, news_data, parent=None):
         super().__init__(parent)
         self.news_data = news_data
@@ -24,28 +27,37 @@ class NewsPopup(QDialog):
         self.setWindowTitle("News Article")
         self.setMinimumSize(600, 400)
         
+        if NewsPopup._FONTS is None:
+            NewsPopup._FONTS = {
+                'symbol': QFont("Arial", 12, QFont.Bold),
+                'headline': QFont("Arial", 11, QFont.Bold),
+                'time': QFont("Arial", 9),
+                'summary': QFont("Arial", 10, QFont.Bold),
+            }
+        fonts = NewsPopup._FONTS
+        
         layout = QVBoxLayout()
         
         # Symbol
         symbol_label = QLabel(f"Symbol: {self.news_data.get('symbol', 'N/A')}")
-        symbol_label.setFont(QFont("Arial", 12, QFont.Bold))
+        symbol_label.setFont(fonts['symbol'])
         layout.addWidget(symbol_label)
         
         # Headline
         headline_label = QLabel(self.news_data.get('headline', 'No headline'))
-        headline_label.setFont(QFont("Arial", 11, QFont.Bold))
+        headline_label.setFont(fonts['headline'])
         headline_label.setWordWrap(True)
         layout.addWidget(headline_label)
         
         # Timestamp
         timestamp = self.news_data.get('timestamp', 'N/A')
         time_label = QLabel(f"Published: {timestamp}")
-        time_label.setFont(QFont("Arial", 9))
+        time_label.setFont(fonts['time'])
         layout.addWidget(time_label)
         
         # Summary/Description
         summary_label = QLabel("Summary:")
-        summary_label.setFont(QFont("Arial", 10, QFont.Bold))
+        summary_label.setFont(fonts['summary'])
         layout.addWidget(summary_label)
         
         summary_text = QTextEdit()
@@ -6,10 +6,11 @@ US Stock Market Momentum & Volatility Scanner
 import sys
 import signal
 import time
-from core.file_manager import FileManager
-from core.logger import Logger
+from concurrent.futures import ThreadPoolExecutor
+from core.file_manager import get_file_manager
+from core.logger import get_logger
 from config.settings import SETTINGS
-from config.api_keys import validate_api_keys
+from config.api_keys import get_api_keys, validate_api_keys
 from scanners import (
     Tier1Alpaca,
     AlpacaValidator,
@@ -22,8 +23,8 @@ from scanners import (
 class SignalScanPRO:
     def __init__(self):
         # Initialize core systems
-        self.file_manager = FileManager()
-        self.logger = Logger()
+        self.file_manager = get_file_manager()
+        self.logger = get_logger()
         
         # Initialize scanners
         self.tier1 = None
@@ -58,6 +59,11 @@ class SignalScanPRO:
             sys.exit(1)
         print("[API-KEYS] OK All required API keys loaded")
         
+        # Optional: confirm each configured key with its provider (run with --verify-keys)
+        if '--verify-keys' in sys.argv:
+            print("[API-KEYS] Verifying keys with providers...")
+            get_api_keys().validate_live()
+        
         print("\n" + "=" * 60)
         print("PHASE 1 STATUS: Foundation Complete OK")
         print("=" * 60)
@@ -153,20 +159,16 @@ class SignalScanPRO:
         """Stop all scanners"""
         print("\n\n[SHUTDOWN] Stopping SignalScan PRO...")
         
-        if self.tier1:
-            self.tier1.stop()
-            
-        if self.tier2:
-            self.tier2.stop()
-            
-        if self.tier3:
-            self.tier3.stop()
-            
-        if self.news:
-            self.news.stop()
-            
-        if self.halts:
-            self.halts.stop()
+        scanners = [
+            scanner for scanner in (self.tier1, self.tier2, self.tier3, self.news, self.halts)
+            if scanner
+        ]
+        
+        # Each stop() joins its threads (up to 5s each) - join them side by
+        # side so shutdown waits for the slowest scanner, not the sum
+        if scanners:
+            with ThreadPoolExecutor(max_workers=len(scanners)) as pool:
+                list(pool.map(lambda scanner: scanner.stop(), scanners))
             
         print("[SHUTDOWN] OK All scanners stopped")
         print("=" * 60)
@@ -5,15 +5,16 @@ US Stock Market Momentum & Volatility Scanner
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add current directory to Python path so gui module can be found
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from PyQt5.QtWidgets import QApplication
-from core.file_manager import FileManager
-from core.logger import Logger
+from core.file_manager import get_file_manager
+from core.logger import get_logger
 from config.settings import SETTINGS
-from config.api_keys import validate_api_keys
+from config.api_keys import get_api_keys, validate_api_keys
 from scanners import (
     Tier1Alpaca,
     AlpacaValidator,
@@ -31,8 +32,8 @@ from gui.main_window import MainWindow
 class SignalScanPRO:
     def __init__(self):
         # Initialize core systems
-        self.file_manager = FileManager()
-        self.logger = Logger()
+        self.file_manager = get_file_manager()
+        self.logger = get_logger()
         
         # Initialize scanners
         self.tier1 = None
@@ -76,6 +77,11 @@ class SignalScanPRO:
             sys.exit(1)
         print("[API-KEYS] ✓ All required API keys loaded")
         
+        # Optional: confirm each configured key with its provider (run with --verify-keys)
+        if '--verify-keys' in sys.argv:
+            print("[API-KEYS] Verifying keys with providers...")
+            get_api_keys().validate_live()
+        
         print("\n" + "=" * 60)
         print("PHASE 1 STATUS: Foundation Complete ✓")
         print("=" * 60)
@@ -192,22 +198,18 @@ class SignalScanPRO:
         """Stop all scanners"""
         print("\n[SHUTDOWN] Stopping SignalScan PRO...")
         
-        if self.tier1:
-            self.tier1.stop()
-        if self.tier2:
-            self.tier2.stop()
-        if self.tier3:
-            self.tier3.stop()
-        if self.news:
-            self.news.stop()
-        if self.halts:
-            self.halts.stop()
-        if self.momo_vector:
-            self.momo_vector.stop()
-        if self.momo_squeeze:
-            self.momo_squeeze.stop()
-        if self.momo_trend:
-            self.momo_trend.stop()
+        scanners = [
+            scanner for scanner in (
+                self.tier1, self.tier2, self.tier3, self.news, self.halts,
+                self.momo_vector, self.momo_squeeze, self.momo_trend
+            ) if scanner
+        ]
+        
+        # Each stop() joins its threads (up to 5s each) - join them side by
+        # side so shutdown waits for the slowest scanner, not the sum
+        if scanners:
+            with ThreadPoolExecutor(max_workers=len(scanners)) as pool:
+                list(pool.map(lambda scanner: scanner.stop(), scanners))
             
         print("[SHUTDOWN] ✓ All systems stopped")
 
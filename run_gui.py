@@ -27,8 +27,8 @@ if __name__ == "__main__":
         sys.exit(1)
     
     try:
-        from core.file_manager import FileManager
-        from core.logger import Logger
+        from core.file_manager import get_file_manager
+        from core.logger import get_logger
         print("✓ Core modules found")
     except ImportError as e:
         print(f"✗ Core modules not found: {e}")
@@ -50,8 +50,8 @@ if __name__ == "__main__":
     print("Launching SignalScan PRO GUI")
     print("=" * 60)
     
-    file_manager = FileManager()
-    logger = Logger()
+    file_manager = get_file_manager()
+    logger = get_logger()
     
     app = QApplication(sys.argv)
     window = MainWindow(file_manager, logger)
@@ -5,20 +5,43 @@ Channels: PreGap, HOD, RunUP, Rvsl, BKG-News
 """
 
 from datetime import datetime, time
+import pytz
 from config.channel_rules import CHANNEL_RULES, MARKET_SESSIONS
 from core.logger import Logger
 
+_EST = pytz.timezone('America/New_York')
+
 
 class ChannelDetector:
+    # Minimal HOD test thresholds used by _check_hod
+    HOD_TEST_PRICE_MIN = 1.0
+    HOD_TEST_GAP_MIN = 5.0
+    
     def __init__(self, logger: Logger):
         self.log = logger
         self.rules = CHANNEL_RULES
         
+        # Session bounds parsed once (MARKET_SESSIONS is static)
+        self._pre_start, self._pre_end = self._session_bounds('premarket')
+        self._reg_start, self._reg_end = self._session_bounds('regular')
+    
+    @staticmethod
+    def _session_bounds(name: str) -> tuple:
+        """(start, end) times of a MARKET_SESSIONS window"""
+        session = MARKET_SESSIONS[name]
+        return (
+            datetime.strptime(session.start, '%H:%M').time(),
+            datetime.strptime(session.end, '%H:%M').time()
+        )
+        
     def detect_channel(self, stock_data: dict) -> str:
         """
         Detect which channel a stock belongs to.
         Returns channel name or None if no match.
         """
+        # Session is checked once; channels that can't fire in it are skipped
+        session = self._current_session()
+        
         # Check each channel in priority order
         
         # 1. BKG-News (highest priority - breaking news)
@@ -26,31 +49,29 @@ class ChannelDetector:
             return 'bkgnews'
             
         # 2. PreGap (pre-market only)
-        if self._check_pregap(stock_data):
-            return 'pregap'
+        if session == 'pre':
+            if self._check_pregap(stock_data):
+                return 'pregap'
             
-        # 3. RunUP (fast movers)
-        if self._check_runup(stock_data):
-            return 'runup'
+        # 3. RunUP (fast movers, regular session only)
+        elif session == 'reg':
+            if self._check_runup(stock_data):
+                return 'runup'
             
-        # 4. HOD (high of day breakout)
+        # 4. HOD (high of day breakout - the test rule has no session gate)
         if self._check_hod(stock_data):
             return 'hod'
             
-        # 5. Rvsl (reversal)
-        if self._check_rvsl(stock_data):
+        # 5. Rvsl (reversal, regular session only)
+        if session == 'reg' and self._check_rvsl(stock_data):
             return 'rvsl'
             
         return None
-        
+    
     def _check_pregap(self, data: dict) -> bool:
-        """Check PreGap channel rules"""
+        """Check PreGap channel rules (caller checks the pre-market session)"""
         rules = self.rules['pregap']
         
-        # Check if in pre-market session
-        if not self._is_premarket():
-            return False
-            
         price = data.get('price', 0)
         gap_pct = data.get('gap_pct', 0)
         rvol = data.get('rvol', 0)
@@ -58,11 +79,11 @@ class ChannelDetector:
         volume_avg = data.get('volume_avg', 0)
         
         return (
-            rules['price_min'] <= price <= rules['price_max'] and
-            gap_pct >= rules['gap_pct_min'] and
-            rvol >= rules['rvol_min'] and
-            float_shares <= rules['float_max'] and
-            volume_avg >= rules['volume_avg_min']
+            rules.price_min <= price <= rules.price_max and
+            gap_pct >= rules.gap_pct_min and
+            rvol >= rules.rvol_min and
+            float_shares <= rules.float_max and
+            volume_avg >= rules.volume_avg_min
         )
         
     #def _check_hod(self, data: dict) -> bool:
@@ -100,16 +121,12 @@ class ChannelDetector:
         self.log.scanner(f"[HOD-TEST] {symbol}: price={price:.2f}, gap_pct={gap_pct:.2f}%")
     
        # Accept anything with price > $1 and gap > 5%
-        return price >= 1.0 and gap_pct >= 5.0
+        return price >= self.HOD_TEST_PRICE_MIN and gap_pct >= self.HOD_TEST_GAP_MIN
   
     def _check_runup(self, data: dict) -> bool:
-        """Check RunUP channel rules"""
+        """Check RunUP channel rules (caller checks the regular session)"""
         rules = self.rules['runup']
         
-        # Check if in regular session
-        if not self._is_regular_hours():
-            return False
-            
         price = data.get('price', 0)
         rvol_5min = data.get('rvol_5min', 0)
         float_shares = data.get('float', 0)
@@ -119,36 +136,32 @@ class ChannelDetector:
         
         # DEBUG: Log why RunUP failed
         symbol = data.get('symbol', 'UNKNOWN')
-        self.log.scanner(f"[DETECTOR-RUNUP] {symbol}: price={price}, rvol_5min={rvol_5min} (need >={rules['rvol_5min_min']}), float={float_shares} (need <={rules['float_max']}), gap={gap_pct}% (need >={rules['gap_pct_min']}), move_5min={move_5min}% (need {rules['quick_move_5min']}), move_10min={move_10min}% (need {rules['quick_move_10min']})")
+        self.log.scanner(f"[DETECTOR-RUNUP] {symbol}: price={price}, rvol_5min={rvol_5min} (need >={rules.rvol_5min_min}), float={float_shares} (need <={rules.float_max}), gap={gap_pct}% (need >={rules.gap_pct_min}), move_5min={move_5min}% (need {rules.quick_move_5min}), move_10min={move_10min}% (need {rules.quick_move_10min})")
         
         return (
-            rules['price_min'] <= price <= rules['price_max'] and
-            rvol_5min >= rules['rvol_5min_min'] and
-            float_shares <= rules['float_max'] and
-            gap_pct >= rules['gap_pct_min'] and
-            (move_5min >= rules['quick_move_5min'] or move_10min >= rules['quick_move_10min'])
+            rules.price_min <= price <= rules.price_max and
+            rvol_5min >= rules.rvol_5min_min and
+            float_shares <= rules.float_max and
+            gap_pct >= rules.gap_pct_min and
+            (move_5min >= rules.quick_move_5min or move_10min >= rules.quick_move_10min)
         )
         
     def _check_rvsl(self, data: dict) -> bool:
-        """Check Rvsl channel rules"""
+        """Check Rvsl channel rules (caller checks the regular session)"""
         rules = self.rules['rvsl']
         
-        # Check if in regular session
-        if not self._is_regular_hours():
-            return False
-            
         price = data.get('price', 0)
         rvol = data.get('rvol', 0)
         gap_pct = abs(data.get('gap_pct', 0))  # Absolute value
         
         # DEBUG: Log why Rvsl failed
         symbol = data.get('symbol', 'UNKNOWN')
-        self.log.scanner(f"[DETECTOR-RVSL] {symbol}: price={price} (need <={rules['price_max']}), rvol={rvol} (need >={rules['rvol_min']}), gap={gap_pct}% (need >={rules['gap_pct_min']})")
+        self.log.scanner(f"[DETECTOR-RVSL] {symbol}: price={price} (need <={rules.price_max}), rvol={rvol} (need >={rules.rvol_min}), gap={gap_pct}% (need >={rules.gap_pct_min})")
         
         return (
-            price <= rules['price_max'] and
-            rvol >= rules['rvol_min'] and
-            gap_pct >= rules['gap_pct_min']
+            price <= rules.price_max and
+            rvol >= rules.rvol_min and
+            gap_pct >= rules.gap_pct_min
         )
         
     def _check_bkgnews(self, data: dict) -> bool:
@@ -160,26 +173,27 @@ class ChannelDetector:
         
         return (
             has_breaking_news and
-            news_age <= rules['news_age_max_hours']
+            news_age <= rules.news_age_max_hours
         )
         
-    def _is_premarket(self) -> bool:
-        """Check if current time is in pre-market session"""
-        import pytz
-        est = pytz.timezone('America/New_York')
-        now = datetime.now(est).time()  # ✅ USE EST TIME
-        session = MARKET_SESSIONS['premarket']
-        start = datetime.strptime(session['start'], '%H:%M').time()
-        end = datetime.strptime(session['end'], '%H:%M').time()
-        return start <= now < end
+    def _current_session(self) -> str:
+        """'pre', 'reg' or 'closed' for the current EST time"""
+        now = datetime.now(_EST).time()
+        if self._is_premarket(now):
+            return 'pre'
+        if self._is_regular_hours(now):
+            return 'reg'
+        return 'closed'
+    
+    def _is_premarket(self, now: time = None) -> bool:
+        """Check if current (or given) EST time is in pre-market session"""
+        if now is None:
+            now = datetime.now(_EST).time()  # ✅ USE EST TIME
+        return self._pre_start <= now < self._pre_end
     
-    def _is_regular_hours(self) -> bool:
-        """Check if current time is in regular trading hours"""
-        import pytz
-        est = pytz.timezone('America/New_York')
-        now = datetime.now(est).time()  # ✅ USE EST TIME
-        session = MARKET_SESSIONS['regular']
-        start = datetime.strptime(session['start'], '%H:%M').time()
-        end = datetime.strptime(session['end'], '%H:%M').time()
-        return start <= now < end
+    def _is_regular_hours(self, now: time = None) -> bool:
+        """Check if current (or given) EST time is in regular trading hours"""
+        if now is None:
+            now = datetime.now(_EST).time()  # ✅ USE EST TIME
+        return self._reg_start <= now < self._reg_end
 
@@ -5,9 +5,12 @@ Tracks active halts and historical halts
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import re
 from datetime import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor
 from threading import Thread, Event
 import pytz
 from queue import Queue
@@ -15,6 +18,22 @@ from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from core.file_manager import FileManager
 from core.logger import Logger
 
+# RSS description patterns (compiled once, used for every feed item)
+_REASON_CODE_RE = re.compile(r'Reason\s*Codes?[:\s]*</td>\s*<td[^>]*>([^<]+)</td>', re.IGNORECASE)
+_HALT_CODE_RE = re.compile(
+    r'\b(LUDP|LUDS|T1|T2|T3|T5|T6|T7|T8|T12|H4|H9|H10|H11|M1|M2|MWC[0-3]|IPO1|IPOQ|IPOE|O1|R[149]|C[349]|C11|M)\b',
+    re.IGNORECASE
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Halt table parser: lxml's C parser when installed, stdlib otherwise
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
 class HaltMonitor(QObject):
     # PyQt5 signal for live GUI updates
     halt_signal = pyqtSignal(dict)
@@ -36,6 +55,18 @@ class HaltMonitor(QObject):
         
         # Fetch interval: 60 seconds (matches NASDAQ RSS update frequency)
         self.fetch_interval = 60  # seconds
+        
+        # One keep-alive session for both NASDAQ endpoints (no new TLS handshake per fetch)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Conditional GET validators + last parsed result per source (reused on 304)
+        self._rss_etag = self._rss_mod = None
+        self._html_etag = self._html_mod = None
+        self._rss_cache = {}
+        self._html_cache = {}
 
     def _process_signal_queue(self):
         """Process queued signal emissions on the main GUI thread"""
@@ -77,30 +108,32 @@ class HaltMonitor(QObject):
         try:
             self.log.halt("[HALT-MONITOR] Fetching halt data from multiple sources...")
             
-            # Source 1: NASDAQ HTML table (most reliable for NASDAQ stocks)
-            nasdaq_html_halts = self._fetch_nasdaq_html_table()
-            self.log.halt(f"[HALT-MONITOR] NASDAQ HTML: {len(nasdaq_html_halts)} halts")
+            # Both sources are network-bound - fetch them concurrently
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                # Source 1: NASDAQ HTML table (most reliable for NASDAQ stocks)
+                html_future = pool.submit(self._fetch_nasdaq_html_table)
+                # Source 2: NASDAQ RSS feed (catches NYSE, AMEX, OTC halts)
+                rss_future = pool.submit(self._fetch_nasdaq_halts)
+                nasdaq_html_halts = html_future.result()
+                nasdaq_rss_halts = rss_future.result()
             
-            # Source 2: NASDAQ RSS feed (catches NYSE, AMEX, OTC halts)
-            nasdaq_rss_halts = self._fetch_nasdaq_halts()
+            self.log.halt(f"[HALT-MONITOR] NASDAQ HTML: {len(nasdaq_html_halts)} halts")
             self.log.halt(f"[HALT-MONITOR] NASDAQ RSS: {len(nasdaq_rss_halts)} halts")
             
-            # Merge: HTML table takes priority (more accurate status)
-            all_halts = {**nasdaq_rss_halts}  # Start with RSS
-            
-            # Override with HTML table data (more reliable)
-            for symbol, halt_data in nasdaq_html_halts.items():
-                all_halts[symbol] = halt_data
-            
-            # Filter: Only keep HALTED stocks from merged data
-            active_halts_only = {
-                symbol: data for symbol, data in all_halts.items()
-                if data.get('status') == 'HALTED'
-            }
+            # Merge in one pass: HTML table first (more accurate status), then
+            # RSS only for symbols the table doesn't have; count active as we go
+            all_halts = {}
+            active_count = 0
+            for source in (nasdaq_html_halts, nasdaq_rss_halts):
+                for symbol, halt_data in source.items():
+                    if symbol not in all_halts:
+                        all_halts[symbol] = halt_data
+                        if halt_data.get('status') == 'HALTED':
+                            active_count += 1
             
             # Save ALL halts to halts.json (including resumed)
             # This ensures historical tracking works
-            self.log.halt(f"[HALT-MONITOR] Total merged: {len(all_halts)} halts")
+            self.log.halt(f"[HALT-MONITOR] Total merged: {len(all_halts)} halts ({active_count} halted)")
             
             if all_halts:
                 self._process_halts(all_halts)
@@ -116,7 +149,7 @@ class HaltMonitor(QObject):
         self.log.halt(f"[HALT-MONITOR] Attempting to fetch from NASDAQ...")
         try:
             from xml.etree import ElementTree as ET
-            import re
+            from io import BytesIO
             import html
             
             url = "https://www.nasdaqtrader.com/rss.aspx?feed=tradehalts"
@@ -125,53 +158,53 @@ class HaltMonitor(QObject):
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
                 'Accept': 'application/json, text/plain, */*'
             }
+            if self._rss_etag:
+                headers['If-None-Match'] = self._rss_etag
+            if self._rss_mod:
+                headers['If-Modified-Since'] = self._rss_mod
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             self.log.halt(f"[HALT-MONITOR] Response: status={response.status_code}, length={len(response.content)}")
             
+            if response.status_code == 304:
+                self.log.halt(f"[HALT-MONITOR] RSS feed unchanged, reusing {len(self._rss_cache)} halts")
+                return self._rss_cache
+            
             if response.status_code != 200:
                 self.log.halt(f"[HALT-MONITOR] NASDAQ API returned status {response.status_code}")
                 return {}
             
-            # Parse RSS/XML response
-            root = ET.fromstring(response.content)
-            items = root.findall('.//item')
-            self.log.halt(f"[HALT-MONITOR] Found {len(items)} items in RSS feed")
-            
+            # Stream the RSS/XML response item by item (each item is freed once parsed)
             halts = {}
+            item_count = 0
             
-            for item in items:
+            for _, item in ET.iterparse(BytesIO(response.content)):
+                if item.tag != 'item':
+                    continue
+                item_count += 1
                 try:
-                    title = item.find('title').text if item.find('title') is not None else ''
-                    description = item.find('description').text if item.find('description') is not None else ''
-                    pub_date = item.find('pubDate').text if item.find('pubDate') is not None else ''
+                    title = item.findtext('title') or ''
+                    description = item.findtext('description') or ''
+                    pub_date = item.findtext('pubDate') or ''
                     
                     # Extract halt reason CODE from HTML table description
                     reason_code = ''
                     if description:
                         # Priority 1: Look for "Reason Code" or "Reason Codes" field in table
-                        reason_code_match = re.search(
-                            r'Reason\s*Codes?[:\s]*</td>\s*<td[^>]*>([^<]+)</td>', 
-                            description, 
-                            re.IGNORECASE
-                        )
+                        reason_code_match = _REASON_CODE_RE.search(description)
                         if reason_code_match:
                             reason_code = reason_code_match.group(1).strip()
                             self.log.halt(f"[HALT-MONITOR] Extracted reason code from table: {reason_code}")
                         else:
                             # Priority 2: Search for known halt codes in description text
-                            code_match = re.search(
-                                r'\b(LUDP|LUDS|T1|T2|T3|T5|T6|T7|T8|T12|H4|H9|H10|H11|M1|M2|MWC[0-3]|IPO1|IPOQ|IPOE|O1|R[149]|C[349]|C11|M)\b',
-                                description,
-                                re.IGNORECASE
-                            )
+                            code_match = _HALT_CODE_RE.search(description)
                             if code_match:
                                 reason_code = code_match.group(1).upper()
                                 self.log.halt(f"[HALT-MONITOR] Found halt code in text: {reason_code}")
                             else:
                                 # Fallback: strip HTML and show cleaned text (first 50 chars)
-                                clean_desc = re.sub(r'<[^>]+>', ' ', description)
-                                clean_desc = re.sub(r'\s+', ' ', clean_desc).strip()
+                                clean_desc = _TAG_RE.sub(' ', description)
+                                clean_desc = _WS_RE.sub(' ', clean_desc).strip()
                                 reason_code = html.unescape(clean_desc)[:50]
                                 self.log.halt(f"[HALT-MONITOR] No code found, using description: {reason_code}")
                     
@@ -216,8 +249,14 @@ class HaltMonitor(QObject):
                 except Exception as e:
                     self.log.crash(f"[HALT-MONITOR] Error parsing halt item: {e}")
                     continue
+                finally:
+                    item.clear()
             
+            self.log.halt(f"[HALT-MONITOR] Found {item_count} items in RSS feed")
             self.log.halt(f"[HALT-MONITOR] Returning {len(halts)} halts")
+            self._rss_etag = response.headers.get('ETag')
+            self._rss_mod = response.headers.get('Last-Modified')
+            self._rss_cache = halts
             return halts
             
         except Exception as e:
@@ -233,22 +272,32 @@ class HaltMonitor(QObject):
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
+            if self._html_etag:
+                headers['If-None-Match'] = self._html_etag
+            if self._html_mod:
+                headers['If-Modified-Since'] = self._html_mod
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             self.log.halt(f"[HALT-MONITOR] HTML response: status={response.status_code}")
             
+            if response.status_code == 304:
+                self.log.halt(f"[HALT-MONITOR] HTML table unchanged, reusing {len(self._html_cache)} halts")
+                return self._html_cache
+            
             if response.status_code != 200:
                 return {}
             
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            from bs4 import BeautifulSoup, SoupStrainer
+            # Only build tree nodes for <table> elements - the rest of the page is skipped
+            soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=SoupStrainer('table'))
+            tables = soup.find_all('table')
             
             # Try multiple selectors - NASDAQ changes their HTML structure
             table = (
                 soup.find('table', {'id': 'HaltData'}) or
                 soup.find('table', {'class': 'haltdata'}) or
                 soup.find('table', string=lambda text: text and 'Halt' in text if text else False) or
-                soup.find_all('table')[0] if soup.find_all('table') else None
+                tables[0] if tables else None
             )
             
             if not table:
@@ -285,6 +334,9 @@ class HaltMonitor(QObject):
                     else:
                         self.log.halt(f"[HALT-MONITOR] RESUMED: {symbol} at {resume_time}")
             
+            self._html_etag = response.headers.get('ETag')
+            self._html_mod = response.headers.get('Last-Modified')
+            self._html_cache = halts
             return halts
             
         except Exception as e:
@@ -17,7 +17,7 @@ from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from core.file_manager import FileManager
 from core.logger import Logger
 from config.api_keys import API_KEYS
-from config.keywords import categorize_news_by_age, should_exclude
+from config.keywords import categorize_news_by_age, match_news_keywords_batch, should_exclude
 
 class NewsAggregator(QObject):
     # PyQt5 signal for live GUI updates
@@ -145,9 +145,11 @@ class NewsAggregator(QObject):
                 news_items = self._fetch_from_provider(provider)
                 
                 if news_items:
-                    # Process news items
-                    for item in news_items:
-                        self._process_news_item(item, provider)
+                    # Keyword-match the whole batch in one pass; each item still goes
+                    # through _process_news_item so misses are recorded as seen
+                    hits = match_news_keywords_batch([item.get('headline') for item in news_items])
+                    for item, hit in zip(news_items, hits):
+                        self._process_news_item(item, provider, keyword_hit=hit)
                 else:
                     # Provider failed, rotate to next
                     self.log.news(f"[NEWS-AGGREGATOR] {provider.upper()} failed, rotating to next provider")
@@ -286,7 +288,7 @@ class NewsAggregator(QObject):
         """Placeholder for Alpha Vantage"""
         return []
             
-    def _process_news_item(self, item: dict, provider: str):
+    def _process_news_item(self, item: dict, provider: str, keyword_hit: bool = None):
         """Process a single news item (de-duplicate and categorize) and emit to GUI"""
         try:
             news_id = item['news_id']
@@ -295,6 +297,10 @@ class NewsAggregator(QObject):
             if news_id in self.seen_news_ids:
                 return
             self.seen_news_ids.add(news_id)
+            
+            # Batch callers pass their keyword result; a miss can never categorize
+            if keyword_hit is False:
+                return
         
             symbol = item['symbol']
         
@@ -314,7 +320,7 @@ class NewsAggregator(QObject):
             age_hours = (datetime.now(timestamp.tzinfo) - timestamp).total_seconds() / 3600
             
             # Categorize by age and keywords
-            category = categorize_news_by_age(headline, age_hours)
+            category = categorize_news_by_age(headline, age_hours, matched=keyword_hit)
             
             # Prepare GUI data
             gui_data = {
@@ -335,7 +341,7 @@ class NewsAggregator(QObject):
                     'age_hours': age_hours,
                     'category': 'breaking'
                 }
-                self.fm.save_bkgnews(bkgnews)
+                self.fm.save_json_debounced('bkgnews', bkgnews)
                 self.log.news(f"[NEWS-AGGREGATOR] BREAKING: {item['symbol']} - {headline[:50]}...")
                 
                 # Queue signal to GUI (THREAD-SAFE)
@@ -349,7 +355,7 @@ class NewsAggregator(QObject):
                     'age_hours': age_hours,
                     'category': 'general'
                 }
-                self.fm.save_news(news)
+                self.fm.save_json_debounced('news', news)
                 self.log.news(f"[NEWS-AGGREGATOR] NEWS: {item['symbol']} - {headline[:50]}...")
                 
                 # Queue signal to GUI (THREAD-SAFE)
@@ -381,10 +387,9 @@ class NewsAggregator(QObject):
                         expired_breaking.append(news_id)
                         self.log.news(f"[NEWS-CLEANUP] Deleted expired breaking: {item['symbol']} ({age_hours:.1f}h old)")
                     elif age_hours > 2:
-                        # Move to general news
-                        item['category'] = 'general'
-                        item['age_hours'] = age_hours
-                        news[news_id] = item
+                        # Move to general news (copy - loaded records are shared
+                        # with the FileManager cache and the GUI reads them)
+                        news[news_id] = {**item, 'category': 'general', 'age_hours': age_hours}
                         expired_breaking.append(news_id)
                         self.log.news(f"[NEWS-CLEANUP] Moved to general: {item['symbol']} ({age_hours:.1f}h old)")
                 except Exception as e:
@@ -293,6 +293,6 @@ class NasdaqHaltScanner:
     def _save_active_halts(self):
         """Save active halts to active_halts.json"""
         try:
-            self.fm.save_active_halts(self.active_halts)
+            self.fm.save_json_debounced('active_halts', self.active_halts)
         except Exception as e:
             self.log.crash(f"[TIER2-HALTS] Error saving active halts: {e}")
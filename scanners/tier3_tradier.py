@@ -30,7 +30,8 @@ class TradierCategorizer(QObject):
         self.fm = file_manager
         self.log = logger
         self.stop_event = Event()
-        self.thread = None
+        # Not "self.thread" - that would shadow QObject.thread()
+        self._run_thread = None
         
         # Thread-safe queue for signal emissions
         self.signal_queue = Queue()
@@ -51,6 +52,9 @@ class TradierCategorizer(QObject):
         # Live data cache (for GUI)
         self.live_data = {}
         
+        # Latest % change vs prev close per symbol (flat view for the MOMO tables)
+        self.changepct_view = {}
+        
         # Channel detector
         self.detector = ChannelDetector(logger)
         
@@ -109,8 +113,8 @@ class TradierCategorizer(QObject):
         """Start Tradier WebSocket categorizer"""
         self.log.scanner("[TIER3-TRADIER] Starting Tradier categorizer (WebSocket)")
         self.stop_event.clear()
-        self.thread = Thread(target=self._run_loop, daemon=True)
-        self.thread.start()
+        self._run_thread = Thread(target=self._run_loop, daemon=True)
+        self._run_thread.start()
     
         # Start daily volume reset thread
         reset_thread = Thread(target=self._daily_reset_loop, daemon=True)
@@ -147,8 +151,8 @@ class TradierCategorizer(QObject):
         self.stop_event.set()
         if self.ws:
             self.ws.close()
-        if self.thread:
-            self.thread.join(timeout=5)
+        if self._run_thread:
+            self._run_thread.join(timeout=5)
             
     def _run_loop(self):
         """Main loop: connect to Tradier WebSocket and maintain subscriptions"""
@@ -425,6 +429,7 @@ class TradierCategorizer(QObject):
                 gap_pct = ((price - prev_close) / prev_close) * 100
                 enriched['gap_pct'] = gap_pct
                 enriched['prev_close'] = prev_close
+                self.changepct_view[symbol] = gap_pct
                 self.log.scanner(f"[TIER3-ENRICH] {symbol}: gap_pct = ({price:.2f} - {prev_close:.2f}) / {prev_close:.2f} = {gap_pct:.2f}%")
             else:
                 enriched['gap_pct'] = 0
@@ -46,6 +46,7 @@ def test_dependencies():
         'pygments': '2.19.2',
         'pytz': '2025.2',
         'alpaca': '0.42.2',  # alpaca-py
+        'orjson': '3.11.3',
     }
     
     all_installed = True
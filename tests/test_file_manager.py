@@ -0,0 +1,55 @@
+"""
+SignalScan PRO - FileManager tests
+Run with: python -m unittest discover tests
+"""
+
+import json
+import math
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.file_manager import FileManager
+
+
+class LegacyJsonTest(unittest.TestCase):
+    """Data files written by the old json.dump code must still load"""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)  # FileManager uses relative data/ paths
+        self.fm = FileManager()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_loads_nan_written_by_json_dump(self):
+        news = {
+            'n1': {'symbol': 'ABCD', 'price': float('nan'), 'change_pct': float('inf')},
+            'n2': {'symbol': 'EFGH', 'price': 1.5, 'change_pct': 2.0},
+        }
+        with open(self.fm.get_file_path('news'), 'w') as f:
+            json.dump(news, f, indent=2)
+
+        loaded = self.fm.load_news()
+
+        self.assertEqual(set(loaded), {'n1', 'n2'})
+        self.assertTrue(math.isnan(loaded['n1']['price']))
+        self.assertEqual(loaded['n1']['change_pct'], float('inf'))
+        self.assertEqual(loaded['n2']['price'], 1.5)
+
+    def test_unparseable_file_returns_default(self):
+        with open(self.fm.get_file_path('news'), 'w') as f:
+            f.write('{not json')
+
+        with self.assertLogs('signalscan.file_manager', level='ERROR'):
+            self.assertEqual(self.fm.load_json('news', default={}), {})
+
+
+if __name__ == '__main__':
+    unittest.main()